@@ -11,6 +11,12 @@ def lint(session):
 	session.run('flake8', 'src/')
 
 
+@nox.session
+def test(session):
+	session.install('-U', '.[test]')
+	session.run('pytest', 'tests/')
+
+
 @nox.session
 def doc(session):
 	shutil.rmtree('docs/_build', ignore_errors=True)
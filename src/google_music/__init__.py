@@ -1,13 +1,23 @@
 from .__about__ import *
 from .api import *
+from .caches import *
 from .clients import *
+from .journals import *
+from .manifests import *
+from .scanners import *
 from .sessions import *
+from .stations import *
 from .token_handlers import *
 
 __all__ = [
 	*__about__.__all__,
 	*api.__all__,
+	*caches.__all__,
 	*clients.__all__,
+	*journals.__all__,
+	*manifests.__all__,
+	*scanners.__all__,
 	*sessions.__all__,
+	*stations.__all__,
 	*token_handlers.__all__,
 ]
@@ -15,7 +15,11 @@ def mobileclient(
 	session=None,
 	token=None,
 	token_handler=FileTokenHandler,
-	token_handler_kwargs=None
+	token_handler_kwargs=None,
+	audio_cache=None,
+	response_cache=None,
+	http_cache=None,
+	search_cache=None
 ):
 	"""Create and authenticate a Google Music mobile client.
 
@@ -44,6 +48,15 @@ def mobileclient(
 		token_handler_kwargs (dict, Optional):
 			Keyword arguments to pass to the ``token_handler``
 			class. These become attributes on the class instance.
+		audio_cache (:class:`~google_music.AudioCache`, Optional):
+			An audio cache consulted before streaming audio.
+		response_cache (:class:`~google_music.ResponseCache`, Optional):
+			A cache of catalog and browse responses.
+		http_cache (:class:`~google_music.HTTPCache`, Optional):
+			A cache of GET responses revalidated with conditional requests.
+			Ignored if ``session`` is given.
+		search_cache (:class:`~google_music.SearchCache`, Optional):
+			A cache of search results and suggestions.
 
 	Returns:
 		MobileClient: An authenticated :class:`~google_music.MobileClient` instance.
@@ -56,7 +69,11 @@ def mobileclient(
 		session=session,
 		token=token,
 		token_handler=FileTokenHandler,
-		token_handler_kwargs=None
+		token_handler_kwargs=None,
+		audio_cache=audio_cache,
+		response_cache=response_cache,
+		http_cache=http_cache,
+		search_cache=search_cache
 	)
 
 
@@ -0,0 +1,1008 @@
+__all__ = [
+	'AudioCache',
+	'Cache',
+	'DiskCache',
+	'HTTPCache',
+	'MemoryCache',
+	'MetadataCache',
+	'ResponseCache',
+	'SearchCache',
+	'StreamURLCache',
+]
+
+import abc
+import contextlib
+import copy
+import hashlib
+import json
+import math
+import os
+import pickle
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import appdirs
+import google_music_proto.musicmanager.calls as mm_calls
+from google_music_proto.musicmanager.pb import locker_pb2
+
+from .__about__ import __author__, __title__
+
+CACHE_DIR = Path(appdirs.user_cache_dir(__title__, __author__))
+
+
+class AudioCache:
+	"""An on-disk LRU cache of streamed audio.
+
+	Audio is written to a temporary file and moved into place,
+	so readers never see partially written files.
+	Temporary files left by an interrupted process are removed on instantiation.
+	Files are touched when read and the least recently used
+	are removed once the cache grows beyond ``max_size``.
+
+	Parameters:
+		dirpath (os.PathLike or str, Optional):
+			The directory to store audio in.
+			Default: ``audio`` in the user cache directory.
+		max_size (int, Optional):
+			Maximum total size of cached audio in bytes.
+			Default: 1 GiB.
+	"""
+
+	def __init__(self, dirpath=None, *, max_size=1024 * 1024 * 1024):
+		if dirpath is None:
+			dirpath = CACHE_DIR / 'audio'
+
+		self.dirpath = Path(dirpath)
+		self.max_size = max_size
+
+		try:
+			self.dirpath.mkdir(parents=True)
+		except FileExistsError:
+			pass
+
+		self._lock = threading.Lock()
+		self._sizes = OrderedDict()
+
+		entries = []
+		for entry in os.scandir(self.dirpath):
+			if entry.name.endswith('.mp3'):
+				stat = entry.stat()
+				entries.append((stat.st_mtime, entry.name, stat.st_size))
+			elif entry.name.endswith('.tmp'):
+				try:
+					os.remove(entry.path)
+				except OSError:
+					pass
+
+		for _, filename, size in sorted(entries):
+			self._sizes[filename] = size
+
+		self._size = sum(self._sizes.values())
+		self._evict()
+
+	def __len__(self):
+		return len(self._sizes)
+
+	def __repr__(self):
+		return f"AudioCache(dirpath={str(self.dirpath)!r}, max_size={self.max_size})"
+
+	@staticmethod
+	def _filename(key):
+		return f"{hashlib.sha1(repr(key).encode()).hexdigest()}.mp3"
+
+	def _evict(self):
+		while self._size > self.max_size and self._sizes:
+			filename, size = self._sizes.popitem(last=False)
+			self._size -= size
+
+			try:
+				os.remove(self.dirpath / filename)
+			except OSError:  # Already removed or open on Windows.
+				pass
+
+	def get(self, key):
+		"""Get cached audio.
+
+		Parameters:
+			key (tuple): A hashable key identifying the item and quality.
+
+		Returns:
+			bytes: Audio, or ``None`` if not cached.
+		"""
+
+		filename = self._filename(key)
+		filepath = self.dirpath / filename
+
+		with self._lock:
+			if filename not in self._sizes:
+				return None
+
+			self._sizes.move_to_end(filename)
+
+		try:
+			with filepath.open('rb') as f:
+				audio = f.read()
+
+			os.utime(filepath)
+		except FileNotFoundError:
+			with self._lock:
+				size = self._sizes.pop(filename, None)
+
+				if size is not None:
+					self._size -= size
+
+			return None
+
+		return audio
+
+	def set(self, key, audio):
+		"""Cache audio.
+
+		Parameters:
+			key (tuple): A hashable key identifying the item and quality.
+			audio (bytes): Audio to cache.
+		"""
+
+		if len(audio) > self.max_size:
+			return
+
+		with self.writer(key) as f:
+			f.write(audio)
+
+	@contextlib.contextmanager
+	def writer(self, key):
+		"""Cache audio as it is written to a file object.
+
+		The audio is only cached if the block exits without an exception.
+
+		>>> with audio_cache.writer(key) as f:
+		... 	for chunk in chunks:
+		... 		f.write(chunk)
+
+		Parameters:
+			key (tuple): A hashable key identifying the item and quality.
+
+		Yields:
+			file object: A binary file object to write audio to.
+		"""
+
+		filename = self._filename(key)
+
+		f = tempfile.NamedTemporaryFile(
+			dir=self.dirpath,
+			suffix='.tmp',
+			delete=False
+		)
+
+		try:
+			with f:
+				yield f
+
+			size = os.path.getsize(f.name)
+
+			if size > self.max_size:
+				os.remove(f.name)
+
+				return
+
+			os.replace(f.name, self.dirpath / filename)
+		except BaseException:
+			try:
+				os.remove(f.name)
+			except OSError:
+				pass
+
+			raise
+
+		with self._lock:
+			self._size -= self._sizes.pop(filename, 0)
+			self._sizes[filename] = size
+			self._size += size
+
+			self._evict()
+
+
+class Cache(abc.ABC):
+	"""Base class for response cache backends.
+
+	Backends store values with an expiry time
+	and evict the least recently used entries when full.
+	Expired entries are still returned by :meth:`get`
+	so callers can decide whether to use stale values.
+	"""
+
+	@abc.abstractmethod
+	def clear(self):
+		"""Remove all entries from the cache."""
+
+	@abc.abstractmethod
+	def delete(self, key):
+		"""Remove an entry from the cache.
+
+		Parameters:
+			key (str): A cache key.
+		"""
+
+	@abc.abstractmethod
+	def get(self, key):
+		"""Get an entry from the cache.
+
+		Parameters:
+			key (str): A cache key.
+
+		Returns:
+			tuple: The cached value and its expiry time as a Unix timestamp,
+			or ``None`` if not cached.
+		"""
+
+	@abc.abstractmethod
+	def set(self, key, value, expires_at):
+		"""Add an entry to the cache.
+
+		Parameters:
+			key (str): A cache key.
+			value: A picklable value.
+			expires_at (float): Expiry time as a Unix timestamp.
+		"""
+
+
+class MemoryCache(Cache):
+	"""An in-memory LRU response cache backend.
+
+	Values are copied when added and returned,
+	so callers can mutate them without changing the cache.
+
+	Parameters:
+		maxsize (int, Optional):
+			Maximum number of entries to cache.
+			Default: ``1024``
+	"""
+
+	def __init__(self, *, maxsize=1024):
+		self.maxsize = maxsize
+
+		self._lock = threading.Lock()
+		self._entries = OrderedDict()
+
+	def __len__(self):
+		return len(self._entries)
+
+	def __repr__(self):
+		return f"MemoryCache(maxsize={self.maxsize})"
+
+	def clear(self):
+		with self._lock:
+			self._entries.clear()
+
+	def delete(self, key):
+		with self._lock:
+			self._entries.pop(key, None)
+
+	def get(self, key):
+		with self._lock:
+			try:
+				entry = self._entries[key]
+			except KeyError:
+				return None
+
+			self._entries.move_to_end(key)
+
+		value, expires_at = entry
+
+		return (copy.deepcopy(value), expires_at)
+
+	def set(self, key, value, expires_at):
+		value = copy.deepcopy(value)
+
+		with self._lock:
+			self._entries[key] = (value, expires_at)
+			self._entries.move_to_end(key)
+
+			while len(self._entries) > self.maxsize:
+				self._entries.popitem(last=False)
+
+
+class DiskCache(Cache):
+	"""An on-disk LRU response cache backend.
+
+	Values are pickled into a SQLite database.
+
+	Parameters:
+		filepath (os.PathLike or str, Optional):
+			The path of the cache database.
+			Default: ``response_cache.sqlite`` in the user cache directory.
+		maxsize (int, Optional):
+			Maximum number of entries to cache.
+			Default: ``10000``
+	"""
+
+	def __init__(self, filepath=None, *, maxsize=10000):
+		if filepath is None:
+			filepath = CACHE_DIR / 'response_cache.sqlite'
+
+		self.filepath = Path(filepath)
+		self.maxsize = maxsize
+
+		try:
+			self.filepath.parent.mkdir(parents=True)
+		except FileExistsError:
+			pass
+
+		self._lock = threading.Lock()
+		self._connection = sqlite3.connect(str(self.filepath), check_same_thread=False)
+
+		with self._connection:
+			self._connection.execute(
+				"CREATE TABLE IF NOT EXISTS responses ("
+				"key TEXT PRIMARY KEY, "
+				"value BLOB NOT NULL, "
+				"expires_at REAL NOT NULL, "
+				"accessed_at REAL NOT NULL"
+				")"
+			)
+			self._connection.execute(
+				"CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)"
+			)
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *args):
+		self.close()
+
+	def __len__(self):
+		with self._lock:
+			return self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+	def __repr__(self):
+		return f"DiskCache(filepath={str(self.filepath)!r}, maxsize={self.maxsize})"
+
+	def clear(self):
+		with self._lock, self._connection:
+			self._connection.execute("DELETE FROM responses")
+
+	def close(self):
+		"""Close the cache database."""
+
+		with self._lock:
+			self._connection.close()
+
+	def delete(self, key):
+		with self._lock, self._connection:
+			self._connection.execute(
+				"DELETE FROM responses WHERE key = ?",
+				(key,)
+			)
+
+	def get(self, key):
+		with self._lock, self._connection:
+			row = self._connection.execute(
+				"SELECT value, expires_at FROM responses WHERE key = ?",
+				(key,)
+			).fetchone()
+
+			if row is None:
+				return None
+
+			self._connection.execute(
+				"UPDATE responses SET accessed_at = ? WHERE key = ?",
+				(time.time(), key)
+			)
+
+		return (pickle.loads(row[0]), row[1])
+
+	def set(self, key, value, expires_at):
+		value = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+		with self._lock, self._connection:
+			self._connection.execute(
+				"INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+				(key, value, expires_at, time.time())
+			)
+			self._connection.execute(
+				"DELETE FROM responses WHERE key IN ("
+				"SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?"
+				")",
+				(self.maxsize,)
+			)
+
+
+class HTTPCache:
+	"""A cache of HTTP response bodies and validators for conditional requests.
+
+	Successful GET responses with an ``ETag`` or ``Last-Modified`` header are stored
+	per account. Requests that withhold the OAuth token, such as audio streams, are not cached.
+	Later requests for the same URL send ``If-None-Match``/``If-Modified-Since``
+	and a ``304 Not Modified`` response is answered from the cache.
+
+	Parameters:
+		backend (:class:`Cache`, Optional):
+			A cache backend.
+			Default: :class:`MemoryCache`
+		max_body_size (int, Optional):
+			Maximum size in bytes of a response body to cache.
+			Default: 1 MiB.
+	"""
+
+	# Headers describing the encoded body that don't apply to the cached decoded body.
+	excluded_headers = frozenset(['content-encoding', 'content-length', 'transfer-encoding'])
+
+	def __init__(self, backend=None, *, max_body_size=1024 * 1024):
+		self.backend = backend if backend is not None else MemoryCache()
+		self.max_body_size = max_body_size
+
+	def __repr__(self):
+		return f"HTTPCache(backend={self.backend!r}, max_body_size={self.max_body_size})"
+
+	def clear(self):
+		"""Remove all responses from the cache."""
+
+		self.backend.clear()
+
+	def get(self, url):
+		"""Get a cached response.
+
+		Parameters:
+			url (str): A cache key for a full request URL including query string.
+
+		Returns:
+			dict: Conditional request ``'validators'``, response ``'headers'``, and ``'content'``,
+			or ``None`` if not cached.
+		"""
+
+		entry = self.backend.get(url)
+
+		return entry[0] if entry is not None else None
+
+	def set(self, url, response):
+		"""Cache a response if it has validators.
+
+		Parameters:
+			url (str): A cache key for a full request URL including query string.
+			response (httpx.Response): A successful response.
+		"""
+
+		if 'no-store' in response.headers.get('Cache-Control', ''):
+			return
+
+		validators = {}
+
+		etag = response.headers.get('ETag')
+		if etag:
+			validators['If-None-Match'] = etag
+
+		last_modified = response.headers.get('Last-Modified')
+		if last_modified:
+			validators['If-Modified-Since'] = last_modified
+
+		if not validators or len(response.content) > self.max_body_size:
+			return
+
+		headers = [
+			(name, value)
+			for name, value in response.headers.items()
+			if name.lower() not in self.excluded_headers
+		]
+
+		# Entries don't expire; they're revalidated on every request.
+		self.backend.set(
+			url,
+			{
+				'validators': validators,
+				'headers': headers,
+				'content': response.content,
+			},
+			math.inf
+		)
+
+
+class MetadataCache:
+	"""A persistent cache of locker tracks created from audio files.
+
+	Creating a locker track parses the tags and audio frames of a file.
+	Cached tracks are stored in serialized form keyed by absolute filepath
+	and only returned while the file's size and modification time are unchanged.
+
+	Parameters:
+		filepath (os.PathLike or str, Optional):
+			The path of the cache database.
+			Default: ``metadata_cache.sqlite`` in the user cache directory.
+	"""
+
+	def __init__(self, filepath=None):
+		if filepath is None:
+			filepath = CACHE_DIR / 'metadata_cache.sqlite'
+
+		self.filepath = Path(filepath)
+
+		try:
+			self.filepath.parent.mkdir(parents=True)
+		except FileExistsError:
+			pass
+
+		self._lock = threading.Lock()
+		self._connection = sqlite3.connect(str(self.filepath), check_same_thread=False)
+
+		with self._connection:
+			self._connection.execute(
+				"CREATE TABLE IF NOT EXISTS tracks ("
+				"filepath TEXT PRIMARY KEY, "
+				"size INTEGER NOT NULL, "
+				"mtime_ns INTEGER NOT NULL, "
+				"track BLOB NOT NULL"
+				")"
+			)
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *args):
+		self.close()
+
+	def __repr__(self):
+		return f"MetadataCache(filepath={str(self.filepath)!r})"
+
+	def close(self):
+		"""Close the cache database."""
+
+		with self._lock:
+			self._connection.close()
+
+	def get(self, filepath):
+		"""Get the cached locker track for a file if it hasn't changed.
+
+		Parameters:
+			filepath (os.PathLike or str): The path to an audio file.
+
+		Returns:
+			locker_pb2.Track: A locker track, or ``None`` if not cached or the file has changed.
+		"""
+
+		filepath = os.path.abspath(filepath)
+
+		try:
+			stat = os.stat(filepath)
+		except OSError:
+			return None
+
+		with self._lock:
+			row = self._connection.execute(
+				"SELECT size, mtime_ns, track FROM tracks WHERE filepath = ?",
+				(filepath,)
+			).fetchone()
+
+		if (
+			row is None
+			or row[0] != stat.st_size
+			or row[1] != stat.st_mtime_ns
+		):
+			return None
+
+		track = locker_pb2.Track()
+		track.ParseFromString(row[2])
+
+		return track
+
+	def get_track_info(self, song):
+		"""Get a locker track for an audio file, using the cache when possible.
+
+		Parameters:
+			song (os.PathLike or str or audio_metadata.Format):
+				The path to an audio file or an instance of :class:`audio_metadata.Format`.
+
+		Returns:
+			locker_pb2.Track: A locker track of the given audio file.
+		"""
+
+		filepath = getattr(song, 'filepath', song)
+
+		track = self.get(filepath)
+
+		if track is None:
+			track = mm_calls.Metadata.get_track_info(song)
+			self.set(filepath, track)
+
+		return track
+
+	def set(self, filepath, track):
+		"""Cache the locker track for a file.
+
+		Parameters:
+			filepath (os.PathLike or str): The path to an audio file.
+			track (locker_pb2.Track): A locker track of the audio file.
+		"""
+
+		filepath = os.path.abspath(filepath)
+		stat = os.stat(filepath)
+
+		with self._lock, self._connection:
+			self._connection.execute(
+				"INSERT OR REPLACE INTO tracks VALUES (?, ?, ?, ?)",
+				(filepath, stat.st_size, stat.st_mtime_ns, track.SerializeToString())
+			)
+
+
+class SearchCache:
+	"""An in-memory LRU cache of search results and suggestions.
+
+	Queries are normalized by case and whitespace.
+	Results are keyed by normalized query, locale, tier, result types, and ``max_results``.
+
+	Search results are complete when every result type has fewer than ``max_results`` results.
+	A query extending a query with complete cached results is answered
+	by filtering those results to items containing every term of the longer query
+	in their :attr:`match_fields`.
+
+	Parameters:
+		maxsize (int, Optional):
+			Maximum number of entries to cache.
+			Default: ``1024``
+		ttl (int, Optional):
+			Seconds to cache entries.
+			Default: ``300``
+	"""
+
+	# Display fields matched against queries; IDs and kinds must not match.
+	match_fields = ('title', 'artist', 'album', 'albumArtist', 'name')
+
+	def __init__(self, *, maxsize=1024, ttl=5 * 60):
+		self.maxsize = maxsize
+		self.ttl = ttl
+
+		self._cache = MemoryCache(maxsize=maxsize)
+
+	def __len__(self):
+		return len(self._cache)
+
+	def __repr__(self):
+		return f"SearchCache(maxsize={self.maxsize}, ttl={self.ttl})"
+
+	@staticmethod
+	def normalize(query):
+		"""Normalize a search query.
+
+		Parameters:
+			query (str): Search text.
+
+		Returns:
+			str: Casefolded search text with collapsed whitespace.
+		"""
+
+		return ' '.join(query.casefold().split())
+
+	def _matches(self, item, terms):
+		values = [
+			item[field].casefold()
+			for field in self.match_fields
+			if isinstance(item.get(field), str)
+		]
+
+		return all(
+			any(term in value for value in values)
+			for term in terms
+		)
+
+	def _get(self, key):
+		entry = self._cache.get(key)
+
+		if entry is None or time.time() >= entry[1]:
+			return None
+
+		return entry[0]
+
+	def _set(self, key, value):
+		self._cache.set(key, value, time.time() + self.ttl)
+
+	def clear(self):
+		"""Remove all entries from the cache."""
+
+		self._cache.clear()
+
+	def get_results(self, query, *, locale, tier, types, max_results):
+		"""Get cached search results.
+
+		Parameters:
+			query (str): Search text.
+			locale (str): The locale of the search.
+			tier (str): The subscription tier of the search.
+			types (list): Requested result types. Empty for all result types.
+			max_results (int): Maximum number of results per type.
+
+		Returns:
+			dict: Search results, or ``None`` if not cached.
+		"""
+
+		query = self.normalize(query)
+		context = (locale, tier, tuple(sorted(types)))
+
+		results = self._get(('results', query, max_results, *context))
+		if results is not None:
+			return results
+
+		terms = query.split()
+		for end in range(len(query), 0, -1):
+			complete_results = self._get(('complete', query[:end], *context))
+
+			if complete_results is not None:
+				filtered_results = {
+					type_: [
+						item
+						for item in items
+						if self._matches(item, terms)
+					]
+					for type_, items in complete_results.items()
+				}
+				results = {
+					type_: items[:max_results]
+					for type_, items in filtered_results.items()
+				}
+
+				# Only the untruncated results are complete for the longer query.
+				self._set(('results', query, max_results, *context), results)
+				self._set(('complete', query, *context), filtered_results)
+
+				return results
+
+		return None
+
+	def set_results(self, query, results, *, locale, tier, types, max_results):
+		"""Cache search results.
+
+		Parameters:
+			query (str): Search text.
+			results (dict): Search results by result type.
+			locale (str): The locale of the search.
+			tier (str): The subscription tier of the search.
+			types (list): Requested result types. Empty for all result types.
+			max_results (int): Maximum number of results per type.
+		"""
+
+		query = self.normalize(query)
+		context = (locale, tier, tuple(sorted(types)))
+
+		self._set(('results', query, max_results, *context), results)
+
+		if all(len(items) < max_results for items in results.values()):
+			self._set(('complete', query, *context), results)
+
+	def get_suggestions(self, query, *, locale, tier):
+		"""Get cached search suggestions.
+
+		Parameters:
+			query (str): Search text.
+			locale (str): The locale of the search.
+			tier (str): The subscription tier of the search.
+
+		Returns:
+			list: Suggested query strings, or ``None`` if not cached.
+		"""
+
+		return self._get(('suggestions', self.normalize(query), locale, tier))
+
+	def set_suggestions(self, query, suggestions, *, locale, tier):
+		"""Cache search suggestions.
+
+		Parameters:
+			query (str): Search text.
+			suggestions (list): Suggested query strings.
+			locale (str): The locale of the search.
+			tier (str): The subscription tier of the search.
+		"""
+
+		self._set(('suggestions', self.normalize(query), locale, tier), suggestions)
+
+
+class StreamURLCache:
+	"""An in-memory LRU cache of resolved stream URLs.
+
+	Stream URLs are signed with an expiry time given
+	in their ``expire`` query parameter.
+	URLs are evicted ``margin`` seconds before they expire,
+	so a cached URL can still be used to start and seek in a stream.
+
+	Parameters:
+		margin (int, Optional):
+			Seconds before expiry to evict a URL.
+			Default: ``60``
+		default_ttl (int, Optional):
+			Seconds to cache URLs without an ``expire`` query parameter.
+			Default: ``60``
+		maxsize (int, Optional):
+			Maximum number of URLs to cache.
+			Default: ``1024``
+	"""
+
+	def __init__(self, *, margin=60, default_ttl=60, maxsize=1024):
+		self.margin = margin
+		self.default_ttl = default_ttl
+		self.maxsize = maxsize
+
+		self._lock = threading.Lock()
+		self._urls = OrderedDict()
+
+	def __len__(self):
+		return len(self._urls)
+
+	def __repr__(self):
+		return f"StreamURLCache(margin={self.margin}, default_ttl={self.default_ttl}, maxsize={self.maxsize})"
+
+	def clear(self):
+		"""Remove all URLs from the cache."""
+
+		with self._lock:
+			self._urls.clear()
+
+	def get(self, key):
+		"""Get a cached stream URL.
+
+		Parameters:
+			key (tuple): A hashable key identifying the item, quality, and device.
+
+		Returns:
+			str: A stream URL, or ``None`` if not cached or about to expire.
+		"""
+
+		with self._lock:
+			try:
+				url, evict_at = self._urls[key]
+			except KeyError:
+				return None
+
+			if time.time() >= evict_at:
+				del self._urls[key]
+
+				return None
+
+			self._urls.move_to_end(key)
+
+		return url
+
+	def set(self, key, url):
+		"""Cache a stream URL.
+
+		Parameters:
+			key (tuple): A hashable key identifying the item, quality, and device.
+			url (str): A stream URL.
+		"""
+
+		try:
+			expire = int(parse_qs(urlsplit(url).query)['expire'][0])
+		except (KeyError, ValueError):
+			evict_at = time.time() + self.default_ttl
+		else:
+			evict_at = expire - self.margin
+
+		with self._lock:
+			self._urls[key] = (url, evict_at)
+			self._urls.move_to_end(key)
+
+			while len(self._urls) > self.maxsize:
+				self._urls.popitem(last=False)
+
+
+class ResponseCache:
+	"""A cache of parsed API responses with per-call TTLs.
+
+	Responses are keyed by call class name and arguments.
+	Only calls with a TTL are cached.
+	Library listings of :class:`~google_music.MobileClient` are also cached
+	under their method name when requested with ``max_stale``.
+
+	>>> import google_music
+	>>> response_cache = google_music.ResponseCache(google_music.DiskCache())
+	>>> mc = google_music.mobileclient('username', response_cache=response_cache)
+
+	Parameters:
+		backend (:class:`Cache`, Optional):
+			A cache backend.
+			Default: :class:`MemoryCache`
+		ttls (dict, Optional):
+			A mapping of call class or listing method names to TTLs in seconds.
+			Merged with :attr:`default_ttls`.
+			A TTL of ``None`` disables caching for a call.
+	"""
+
+	# Catalog and browse data that changes at most a few times a day.
+	default_ttls = {
+		'BrowseStationCategories': 6 * 60 * 60,
+		'BrowseStations': 60 * 60,
+		'BrowseTopChart': 60 * 60,
+		'BrowseTopChartForGenre': 60 * 60,
+		'BrowseTopChartGenres': 6 * 60 * 60,
+		'Config': 60 * 60,
+		'ExploreGenres': 6 * 60 * 60,
+		'ExploreTabs': 60 * 60,
+		'FetchAlbum': 6 * 60 * 60,
+		'FetchArtist': 6 * 60 * 60,
+		'FetchTrack': 6 * 60 * 60,
+		'ListenNowSituations': 15 * 60,
+		'PodcastBrowse': 60 * 60,
+		'PodcastBrowseHierarchy': 6 * 60 * 60,
+		# Library listings are only cached when requested with ``max_stale``.
+		'playlists': 5 * 60,
+		'podcasts': 5 * 60,
+		'songs': 5 * 60,
+	}
+
+	def __init__(self, backend=None, *, ttls=None):
+		self.backend = backend if backend is not None else MemoryCache()
+		self.ttls = {**self.default_ttls, **(ttls or {})}
+
+	def __repr__(self):
+		return f"ResponseCache(backend={self.backend!r})"
+
+	@staticmethod
+	def key(*parts):
+		"""Create a cache key.
+
+		Parameters:
+			parts: JSON-serializable parts of the key, e.g. call class name and arguments.
+
+		Returns:
+			str: A cache key.
+		"""
+
+		return json.dumps(parts, sort_keys=True, default=repr)
+
+	def clear(self):
+		"""Remove all responses from the cache."""
+
+		self.backend.clear()
+
+	def get(self, key):
+		"""Get a cached response if it hasn't expired.
+
+		Parameters:
+			key (str): A cache key.
+
+		Returns:
+			A cached response, or ``None`` if not cached or expired.
+		"""
+
+		entry = self.backend.get(key)
+
+		if entry is None or time.time() >= entry[1]:
+			return None
+
+		return entry[0]
+
+	def get_entry(self, key):
+		"""Get a cached response whether or not it has expired.
+
+		Parameters:
+			key (str): A cache key.
+
+		Returns:
+			tuple: The cached response and its expiry time as a Unix timestamp,
+			or ``None`` if not cached.
+		"""
+
+		return self.backend.get(key)
+
+	def set(self, key, value, ttl):
+		"""Cache a response.
+
+		Parameters:
+			key (str): A cache key.
+			value: A picklable response.
+			ttl (int): Seconds until the response expires.
+		"""
+
+		self.backend.set(key, value, time.time() + ttl)
+
+	def ttl(self, name):
+		"""Get the TTL of a call class or listing.
+
+		Parameters:
+			name (str): A call class or listing method name.
+
+		Returns:
+			int: A TTL in seconds, or ``None`` if the call isn't cached.
+		"""
+
+		return self.ttls.get(name)
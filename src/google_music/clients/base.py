@@ -1,4 +1,8 @@
+import copy
+import json
+import threading
 import time
+from concurrent.futures import Future
 
 from tenacity import retry, stop_after_attempt, wait_exponential
 
@@ -13,6 +17,10 @@ except ImportError:
 
 # TODO: Configurable token updater/saver/loader.
 class GoogleMusicClient:
+	# POST calls that only read data.
+	# Identical concurrent calls to these and GET calls share one request.
+	_read_calls = frozenset()
+
 	def __init__(
 		self,
 		username,
@@ -20,9 +28,15 @@ class GoogleMusicClient:
 		session=None,
 		token=None,
 		token_handler=FileTokenHandler,
-		token_handler_kwargs=None
+		token_handler_kwargs=None,
+		response_cache=None,
+		http_cache=None
 	):
 		self._username = username or ''
+		self.response_cache = response_cache
+
+		self._in_flight = {}
+		self._in_flight_lock = threading.Lock()
 
 		if token_handler_kwargs is None:
 			token_handler_kwargs = {}
@@ -39,7 +53,8 @@ class GoogleMusicClient:
 				self.client_id,
 				self.client_secret,
 				self.oauth_scope,
-				token=token
+				token=token,
+				http_cache=http_cache
 			)
 		)
 
@@ -66,17 +81,90 @@ class GoogleMusicClient:
 
 		return self._username
 
+	def _call(self, call_cls, *args, retries=True, **kwargs):
+		call = call_cls(*args, **kwargs)
+
+		# Override default hl/tier params from google-music-proto for Mobileclient.
+		params = {**call.params, **self._session.params}
+
+		ttl = None
+		if self.response_cache is not None:
+			ttl = self.response_cache.ttl(call_cls.__name__)
+
+		if ttl is not None:
+			cache_key = self.response_cache.key(
+				self.username,
+				call_cls.__name__,
+				args,
+				kwargs,
+				params
+			)
+			parsed_response = self.response_cache.get(cache_key)
+
+			if parsed_response is not None:
+				return parsed_response
+
+		# Retried requests make up to 5 attempts with exponential backoff.
+		request = self._request if retries else self._send
+
+		if call.method == 'GET' or call_cls.__name__ in self._read_calls:
+			parsed_response = self._call_once(request, call, params)
+		else:
+			parsed_response = request(call, params)
+
+		if ttl is not None:
+			self.response_cache.set(cache_key, parsed_response, ttl)
+
+		return parsed_response
+
+	def _call_once(self, request, call, params):
+		key = json.dumps(
+			[call.method, call.url, params, call.body],
+			sort_keys=True,
+			default=repr
+		)
+
+		with self._in_flight_lock:
+			in_flight = self._in_flight.get(key)
+			leader = in_flight is None
+
+			if leader:
+				in_flight = self._in_flight[key] = {'future': Future(), 'waiters': 0}
+			else:
+				in_flight['waiters'] += 1
+
+		future = in_flight['future']
+
+		# Callers may mutate responses, so each waiter gets its own copy.
+		if not leader:
+			return copy.deepcopy(future.result())
+
+		try:
+			parsed_response = request(call, params)
+		except BaseException as e:
+			future.set_exception(e)
+
+			raise
+		else:
+			future.set_result(parsed_response)
+		finally:
+			with self._in_flight_lock:
+				del self._in_flight[key]
+
+		if in_flight['waiters']:
+			return copy.deepcopy(parsed_response)
+
+		return parsed_response
+
 	@retry(
 		reraise=True,
 		stop=stop_after_attempt(5),
 		wait=wait_exponential(multiplier=1, max=10),
 	)
-	def _call(self, call_cls, *args, **kwargs):
-		call = call_cls(*args, **kwargs)
-
-		# Override default hl/tier params from google-music-proto for Mobileclient.
-		params = {**call.params, **self._session.params}
+	def _request(self, call, params):
+		return self._send(call, params)
 
+	def _send(self, call, params):
 		response = self._session.request(
 			call.method,
 			call.url,
@@ -95,6 +183,20 @@ class GoogleMusicClient:
 
 		return call.parse_response(response.headers, response.content)
 
+	def _stream(self, call_cls, *args, headers=None, **kwargs):
+		call = call_cls(*args, **kwargs)
+
+		params = {**call.params, **self._session.params}
+
+		return self._session.stream(
+			call.method,
+			call.url,
+			headers={**call.headers, **(headers or {})},
+			data=call.body,
+			params=params,
+			allow_redirects=call.follow_redirects
+		)
+
 	def login(self):
 		"""Log in to Google Music.
 
@@ -1,12 +1,21 @@
 __all__ = ['MobileClient']
 
+import asyncio
+import functools
+import json
+import os
 import re
-from collections import defaultdict
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, TimeoutError, as_completed, wait
 from operator import itemgetter
+from pathlib import Path
 from uuid import getnode as get_mac
 from uuid import uuid4
 
 import google_music_proto.mobileclient.calls as mc_calls
+import httpx
 import more_itertools
 from google_music_proto.mobileclient.types import (
 	ListenNowItemType,
@@ -17,6 +26,8 @@ from google_music_proto.oauth import IOS_CLIENT_ID, IOS_CLIENT_SECRET, MOBILE_SC
 from tbm_utils import cast_to_list
 
 from .base import GoogleMusicClient
+from ..caches import StreamURLCache
+from ..stations import StationQueue
 from ..token_handlers import FileTokenHandler
 from ..utils import create_mac_string, get_ple_prev_next
 
@@ -61,12 +72,37 @@ class MobileClient(GoogleMusicClient):
 		token_handler_kwargs (dict, Optional):
 			Keyword arguments to pass to the ``token_handler``
 			class. These become attributes on the class instance.
+		audio_cache (:class:`~google_music.AudioCache`, Optional):
+			An audio cache consulted by :meth:`stream` and :meth:`stream_iter`
+			before resolving a stream URL.
+			Can be changed after instantiation.
+		response_cache (:class:`~google_music.ResponseCache`, Optional):
+			A cache of catalog and browse responses.
+			Can be changed after instantiation.
+		http_cache (:class:`~google_music.HTTPCache`, Optional):
+			A cache of GET responses revalidated with conditional requests.
+			Ignored if ``session`` is given.
+		search_cache (:class:`~google_music.SearchCache`, Optional):
+			A cache of results for :meth:`search_google` and :meth:`search_suggestion`.
+			Can be changed after instantiation.
 	"""
 
 	client = 'mobileclient'
 	client_id = IOS_CLIENT_ID
 	client_secret = IOS_CLIENT_SECRET
 	oauth_scope = MOBILE_SCOPE
+	_read_calls = frozenset(
+		[
+			'EphemeralTop',
+			'ListenNowSituations',
+			'PlaylistEntriesShared',
+			'PlaylistEntryFeed',
+			'PlaylistFeed',
+			'QuerySuggestion',
+			'RadioStation',
+			'TrackFeed',
+		]
+	)
 
 	def __init__(
 		self,
@@ -77,16 +113,28 @@ class MobileClient(GoogleMusicClient):
 		session=None,
 		token=None,
 		token_handler=FileTokenHandler,
-		token_handler_kwargs=None
+		token_handler_kwargs=None,
+		audio_cache=None,
+		response_cache=None,
+		http_cache=None,
+		search_cache=None
 	):
 		super().__init__(
 			username,
 			session=session,
 			token=token,
 			token_handler=token_handler,
-			token_handler_kwargs=None
+			token_handler_kwargs=None,
+			response_cache=response_cache,
+			http_cache=http_cache
 		)
 
+		self._stream_url_cache = StreamURLCache()
+		self._refreshing = set()
+		self._refreshing_lock = threading.Lock()
+		self.audio_cache = audio_cache
+		self.search_cache = search_cache
+
 		if self.login():
 			self.locale = locale
 			self.tier = 'fr'
@@ -170,6 +218,233 @@ class MobileClient(GoogleMusicClient):
 			{'tier': tier}
 		)
 
+	@staticmethod
+	def _item_id(item):
+		for id_field in ['episodeId', 'trackId', 'storeId', 'id']:
+			if id_field in item:
+				return item[id_field]
+
+		raise ValueError("Item does not contain an ID field.")
+
+	@staticmethod
+	def _range_header(start, end):
+		if start is None and end is None:
+			return {}
+
+		return {'Range': f"bytes={start or 0}-{'' if end is None else end}"}
+
+	def _refresh(self, key, ttl, fetch):
+		with self._refreshing_lock:
+			if key in self._refreshing:
+				return
+
+			self._refreshing.add(key)
+
+		def refresh():
+			try:
+				self.response_cache.set(key, fetch(), ttl)
+			finally:
+				with self._refreshing_lock:
+					self._refreshing.discard(key)
+
+		threading.Thread(target=refresh, daemon=True).start()
+
+	def _stale_while_revalidate(self, name, fetch, *, key_parts=(), max_stale=None):
+		if self.response_cache is None or max_stale is None:
+			return fetch()
+
+		ttl = self.response_cache.ttl(name)
+
+		if ttl is None:
+			return fetch()
+
+		key = self.response_cache.key(self.username, name, key_parts)
+		entry = self.response_cache.get_entry(key)
+
+		if entry is not None:
+			value, expires_at = entry
+			now = time.time()
+
+			if now < expires_at:
+				return value
+			elif now < expires_at + max_stale:
+				self._refresh(key, ttl, fetch)
+
+				return value
+
+		value = fetch()
+		self.response_cache.set(key, value, ttl)
+
+		return value
+
+	@staticmethod
+	def _catalog_links(node_type, info):
+		if node_type == 'album':
+			for artist_id in info.get('artistId', []):
+				yield ('artist', artist_id)
+		elif node_type == 'artist':
+			for artist in info.get('related_artists', []):
+				yield ('artist', artist['artistId'])
+
+			for album in info.get('albums', []):
+				yield ('album', album['albumId'])
+		elif node_type == 'genre':
+			for genre in info:
+				yield ('genre', genre['id'])
+
+	@staticmethod
+	def _fetch_many(fetch, ids, *, max_workers=8):
+		ids = list(ids)
+		results = {}
+
+		with ThreadPoolExecutor(max_workers=max_workers) as executor:
+			futures = {
+				executor.submit(fetch, id_): id_
+				for id_ in dict.fromkeys(ids)
+			}
+
+			for future in as_completed(futures):
+				try:
+					results[futures[future]] = future.result()
+				except Exception as e:  # noqa
+					results[futures[future]] = e
+
+		return [results[id_] for id_ in ids]
+
+	@staticmethod
+	def _album_seed(album):
+		return {
+			'albumId': album['albumId'],
+			'seedType': StationSeedType.album.value,
+		}
+
+	@staticmethod
+	def _artist_seed(artist, *, only_artist=False):
+		if only_artist:
+			seed_type = StationSeedType.artist_only
+		else:
+			seed_type = StationSeedType.artist_related
+
+		return {
+			'artistId': artist['artistId'],
+			'seedType': seed_type.value,
+		}
+
+	@staticmethod
+	def _genre_seed(genre):
+		return {
+			'genreId': genre['id'],
+			'seedType': StationSeedType.genre.value,
+		}
+
+	@staticmethod
+	def _song_seed(song):
+		if 'storeId' in song:
+			return {
+				'trackId': song['storeId'],
+				'seedType': StationSeedType.store_track.value,
+			}
+		else:
+			return {
+				'trackLockerId': song['id'],
+				'seedType': StationSeedType.library_track.value,
+			}
+
+	@staticmethod
+	def _station_info(
+		*,
+		station_id=None,
+		seed=None,
+		num_songs=25,
+		only_library=False,
+		recently_played=None
+	):
+		station_info = {
+			'num_entries': num_songs,
+			'library_content_only': only_library,
+		}
+
+		if station_id is not None:
+			station_info['station_id'] = station_id
+		else:
+			station_info['seed'] = seed
+
+		if recently_played is not None:
+			station_info['recently_played'] = recently_played
+
+		return station_info
+
+	@staticmethod
+	def _seed_key(seed):
+		seed_id = next(
+			(
+				seed[field]
+				for field in [
+					'albumId',
+					'artistId',
+					'curatedStationId',
+					'genreId',
+					'trackId',
+					'trackLockerId',
+				]
+				if field in seed
+			),
+			None
+		)
+
+		return ('seed', str(seed.get('seedType')), seed_id)
+
+	def _station_request_key(self, station_info):
+		station_id = station_info.get('station_id')
+
+		if station_id == 'IFL':
+			return self._seed_key({'seedType': StationSeedType.ifl.value})
+		elif station_id is not None:
+			return ('id', station_id)
+		else:
+			return self._seed_key(station_info['seed'])
+
+	def _station_feed(self, station_infos, *, batch_size=None):
+		batch_size = batch_size or max(len(station_infos), 1)
+
+		stations = []
+		for batch in more_itertools.chunked(station_infos, batch_size):
+			# The server may drop or reorder stations,
+			# so returned stations are matched to requests by station ID or seed.
+			# Key before the call, which changes the station info of IFL to a seed.
+			request_keys = [
+				self._station_request_key(station_info)
+				for station_info in batch
+			]
+
+			response = self._call(
+				mc_calls.RadioStationFeed,
+				station_infos=batch
+			)
+			station_feed = response.body.get('data', {}).get('stations', [])
+
+			unmatched = list(station_feed)
+			for request_key in request_keys:
+				station = next(
+					(
+						station
+						for station in unmatched
+						if request_key in [
+							('id', station.get('id')),
+							self._seed_key(station.get('seed', {})),
+						]
+					),
+					None
+				)
+
+				if station is None:
+					stations.append({})
+				else:
+					unmatched.remove(station)
+					stations.append(station)
+
+		return stations
+
 	def album(self, album_id, *, include_description=True, include_songs=True):
 		"""Get information about an album.
 
@@ -197,6 +472,44 @@ class MobileClient(GoogleMusicClient):
 
 		return album_info
 
+	def albums(
+		self,
+		album_ids,
+		*,
+		include_description=True,
+		include_songs=True,
+		max_workers=8
+	):
+		"""Get information about many albums concurrently.
+
+		Parameters:
+			album_ids (list):
+				Album IDs.
+				Album IDs start with a 'B'.
+			include_description (bool, Optional):
+				Include description of the albums in the returned dicts.
+			include_songs (bool, Optional):
+				Include songs from the albums in the returned dicts.
+				Default: ``True``.
+			max_workers (int, Optional):
+				Number of worker threads.
+				Default: ``8``
+
+		Returns:
+			list: Album information dicts in the order of ``album_ids``.
+			The exception raised for an album is returned in its place.
+		"""
+
+		return self._fetch_many(
+			functools.partial(
+				self.album,
+				include_description=include_description,
+				include_songs=include_songs
+			),
+			album_ids,
+			max_workers=max_workers
+		)
+
 	def artist(
 		self, artist_id, *, include_albums=True, num_related_artists=5, num_top_tracks=5
 	):
@@ -231,6 +544,50 @@ class MobileClient(GoogleMusicClient):
 
 		return artist_info
 
+	def artists(
+		self,
+		artist_ids,
+		*,
+		include_albums=True,
+		num_related_artists=5,
+		num_top_tracks=5,
+		max_workers=8
+	):
+		"""Get information about many artists concurrently.
+
+		Parameters:
+			artist_ids (list):
+				Artist IDs.
+				Artist IDs start with an 'A'.
+			include_albums (bool, Optional):
+				Include albums by the artists in returned dicts.
+				Default: ``True``.
+			num_related_artists (int, Optional):
+				Include up to given number of related artists in returned dicts.
+				Default: ``5``.
+			num_top_tracks (int, Optional):
+				Include up to given number of top tracks in returned dicts.
+				Default: ``5``.
+			max_workers (int, Optional):
+				Number of worker threads.
+				Default: ``8``
+
+		Returns:
+			list: Artist information dicts in the order of ``artist_ids``.
+			The exception raised for an artist is returned in its place.
+		"""
+
+		return self._fetch_many(
+			functools.partial(
+				self.artist,
+				include_albums=include_albums,
+				num_related_artists=num_related_artists,
+				num_top_tracks=num_top_tracks
+			),
+			artist_ids,
+			max_workers=max_workers
+		)
+
 	def browse_podcasts(self, podcast_genre_id='JZCpodcasttopchartall'):
 		"""Get the podcasts for a genre from the Podcasts browse tab.
 
@@ -304,6 +661,165 @@ class MobileClient(GoogleMusicClient):
 
 		return config_list
 
+	def crawl_catalog(
+		self,
+		seeds,
+		*,
+		max_depth=2,
+		max_nodes=None,
+		max_workers=8,
+		checkpoint=None,
+		checkpoint_interval=100
+	):
+		"""Crawl the catalog breadth-first from artists, albums, and genres.
+
+		Artists link to their related artists and albums,
+		albums link to their artists,
+		and genres link to their sub-genres.
+		Each node is fetched at most once.
+
+		With a ``checkpoint`` file, queued and fetched nodes are appended to it as JSON lines,
+		flushed periodically and when the crawl stops.
+		If the file exists, the crawl resumes from it and ``seeds`` is ignored.
+		Nodes being fetched when the crawl stopped are fetched again.
+
+		Parameters:
+			seeds (list):
+				``(node_type, id)`` tuples where ``node_type`` is one of
+				``'album'``, ``'artist'``, or ``'genre'``.
+				A genre ID of ``None`` starts from the top-level genres.
+			max_depth (int, Optional):
+				Maximum number of links to follow from a seed.
+				Default: ``2``
+			max_nodes (int, Optional):
+				Maximum number of nodes to fetch.
+				Default: No limit.
+			max_workers (int, Optional):
+				Number of worker threads.
+				Default: ``8``
+			checkpoint (os.PathLike or str, Optional):
+				The path of a JSON lines checkpoint file.
+			checkpoint_interval (int, Optional):
+				Number of fetched nodes between flushes of the checkpoint file.
+				Default: ``100``
+
+		Yields:
+			dict: A result dict for each node, in order of completion, with keys:
+			``'type'``, ``'id'``, ``'depth'``, ``'info'``, and ``'error'``.
+			``'info'`` is an album or artist dict or a list of sub-genre dicts.
+		"""
+
+		fetchers = {
+			'album': functools.partial(self.album, include_description=False),
+			'artist': self.artist,
+			'genre': self.explore_genres,
+		}
+
+		if checkpoint is not None:
+			checkpoint = Path(checkpoint)
+
+		seen = set()
+		frontier = deque()
+		num_fetched = 0
+
+		if checkpoint is not None and checkpoint.is_file():
+			# Queued nodes that haven't been fetched, in queue order.
+			pending = {}
+
+			with checkpoint.open('r', encoding='utf-8') as f:
+				for line in f:
+					try:
+						event, node_type, node_id, *depth = json.loads(line)
+					except ValueError:  # Partially written line from a crash.
+						continue
+
+					if event == 'queued':
+						seen.add((node_type, node_id))
+						pending[(node_type, node_id)] = depth[0]
+					elif event == 'fetched':
+						pending.pop((node_type, node_id), None)
+						num_fetched += 1
+
+			frontier.extend(
+				(node_type, node_id, depth)
+				for (node_type, node_id), depth in pending.items()
+			)
+			seeds = []
+		else:
+			seeds = list(seeds)
+
+			for node_type, _ in seeds:
+				if node_type not in fetchers:
+					raise ValueError(f"'node_type' must be one of {list(fetchers)}.")
+
+		# Appending events keeps checkpoints proportional to crawl progress.
+		checkpoint_file = checkpoint.open('a', encoding='utf-8') if checkpoint is not None else None
+
+		def queue_node(node_type, node_id, depth):
+			seen.add((node_type, node_id))
+			frontier.append((node_type, node_id, depth))
+
+			if checkpoint_file is not None:
+				checkpoint_file.write(json.dumps(['queued', node_type, node_id, depth]) + '\n')
+
+		for node_type, node_id in seeds:
+			if (node_type, node_id) not in seen:
+				queue_node(node_type, node_id, 0)
+
+		in_flight = {}
+
+		with ThreadPoolExecutor(max_workers=max_workers) as executor:
+			try:
+				while True:
+					while (
+						frontier
+						and len(in_flight) < max_workers * 2
+						and (max_nodes is None or num_fetched + len(in_flight) < max_nodes)
+					):
+						node = frontier.popleft()
+						in_flight[executor.submit(fetchers[node[0]], node[1])] = node
+
+					if not in_flight:
+						break
+
+					done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+
+					for future in done:
+						node_type, node_id, depth = in_flight.pop(future)
+						num_fetched += 1
+
+						try:
+							info = future.result()
+						except Exception as e:  # noqa
+							info, error = None, e
+						else:
+							error = None
+
+							if depth < max_depth:
+								for link in self._catalog_links(node_type, info):
+									if link not in seen:
+										queue_node(*link, depth + 1)
+
+						if checkpoint_file is not None:
+							checkpoint_file.write(json.dumps(['fetched', node_type, node_id]) + '\n')
+
+							if num_fetched % checkpoint_interval == 0:
+								checkpoint_file.flush()
+
+						yield {
+							'type': node_type,
+							'id': node_id,
+							'depth': depth,
+							'info': info,
+							'error': error,
+						}
+			finally:
+				for future in in_flight:
+					future.cancel()
+
+				if checkpoint_file is not None:
+					checkpoint_file.close()
+
 	# TODO: Check success/failure?
 	def device_deauthorize(self, device):
 		"""Deauthorize a registered device.
@@ -371,6 +887,10 @@ class MobileClient(GoogleMusicClient):
 				Genre ID from :meth:`explore_genres` to explore.
 				Default: ``None``.
 
+		Note:
+			With a :attr:`response_cache`, explore tabs are cached
+			per ``num_items``, ``genre_id``, :attr:`locale`, and :attr:`tier`.
+
 		Returns:
 			dict: Explore tabs content.
 		"""
@@ -388,6 +908,75 @@ class MobileClient(GoogleMusicClient):
 
 		return explore_tabs
 
+	def home_screen(self, *, timeout=10, timeouts=None):
+		"""Get the listings of the home screen concurrently.
+
+		Parts are fetched with:
+			- ``'explore_tabs'``: :meth:`explore_tabs`
+			- ``'listen_now_dismissed_items'``: :meth:`listen_now_dismissed_items`
+			- ``'listen_now_items'``: :meth:`listen_now_items`
+			- ``'situations'``: :meth:`situations`
+			- ``'station_feed'``: :meth:`station_feed`
+			- ``'top_charts'``: :meth:`top_charts`
+
+		Parameters:
+			timeout (float, Optional):
+				Seconds to wait for each part.
+				Default: ``10``
+			timeouts (dict, Optional):
+				A mapping of part names to seconds to wait for that part.
+				Overrides ``timeout``.
+
+		Returns:
+			dict: Results of completed parts by part name,
+			and an ``'errors'`` dict of exceptions by part name for parts
+			that raised or timed out.
+		"""
+
+		parts = {
+			'explore_tabs': self.explore_tabs,
+			'listen_now_dismissed_items': self.listen_now_dismissed_items,
+			'listen_now_items': self.listen_now_items,
+			'situations': self.situations,
+			'station_feed': self.station_feed,
+			'top_charts': self.top_charts,
+		}
+		timeouts = {
+			name: (timeouts or {}).get(name, timeout)
+			for name in parts
+		}
+
+		home = {'errors': {}}
+
+		executor = ThreadPoolExecutor(max_workers=len(parts))
+
+		try:
+			start = time.monotonic()
+			futures = {
+				name: executor.submit(part)
+				for name, part in parts.items()
+			}
+
+			# Wait for parts in order of deadline
+			# so each wait only takes up its remaining time.
+			for name in sorted(futures, key=timeouts.get):
+				remaining = max(start + timeouts[name] - time.monotonic(), 0)
+
+				try:
+					home[name] = futures[name].result(timeout=remaining)
+				except TimeoutError:
+					futures[name].cancel()
+					home['errors'][name] = TimeoutError(
+						f"Timed out after {timeouts[name]} seconds."
+					)
+				except Exception as e:  # noqa
+					home['errors'][name] = e
+		finally:
+			# Don't wait for parts that timed out.
+			executor.shutdown(wait=False)
+
+		return home
+
 	def listen_now_dismissed_items(self):
 		"""Get a listing of items dismissed from Listen Now tab."""
 
@@ -417,15 +1006,39 @@ class MobileClient(GoogleMusicClient):
 
 		return dict(listen_now_items)
 
-	def new_releases(self, genre_id=None):
-		new_releases_tab = self.explore_tabs(genre_id=genre_id)['new_releases']
+	def new_releases(self, genre_id=None, *, num_items=100):
+		"""Get a listing of new releases from the explore tabs.
+
+		Parameters:
+			genre_id (str, Optional):
+				Genre ID from :meth:`explore_genres` to explore.
+				Default: ``None``.
+			num_items (int, Optional):
+				Number of items per explore tab to request.
+				Default: ``100``
 
+		Returns:
+			list: New release dicts.
+		"""
+
+		new_releases_tab = self.explore_tabs(
+			num_items=num_items,
+			genre_id=genre_id
+		).get('new_releases', {})
+
+		# Explore tabs may come from the response cache, so entities aren't modified.
+		# The entity is the last value besides 'kind'.
 		new_releases = []
-		if 'groups' in new_releases_tab:
-			for group in new_releases_tab['groups']:
-				for entity in group['entities']:
-					del entity['kind']
-					new_releases.append(entity.popitem()[1])
+		for group in new_releases_tab.get('groups', []):
+			for entity in group['entities']:
+				values = [
+					value
+					for key, value in entity.items()
+					if key != 'kind'
+				]
+
+				if values:
+					new_releases.append(values[-1])
 
 		return new_releases
 
@@ -858,27 +1471,39 @@ class MobileClient(GoogleMusicClient):
 
 		self.playlist_delete(playlist)
 
-	def playlists(self, *, include_songs=False):
+	def playlists(self, *, include_songs=False, max_stale=None):
 		"""Get a listing of library playlists.
 
 		Parameters:
 			include_songs (bool, Optional):
 				Include songs in the returned playlist dicts.
 				Default: ``False``.
+			max_stale (int, Optional):
+				Seconds past expiry a listing from :attr:`response_cache` can be returned
+				while it is refreshed in the background.
+				Default: Don't use the response cache.
 
 		Returns:
 			list: A list of playlist dicts.
 		"""
 
-		playlist_list = []
-		for chunk in self.playlists_iter(page_size=49995):
-			for playlist in chunk:
-				if include_songs:
-					playlist['tracks'] = self.playlist_songs(playlist)
+		def fetch():
+			playlist_list = []
+			for chunk in self.playlists_iter(page_size=49995):
+				for playlist in chunk:
+					if include_songs:
+						playlist['tracks'] = self.playlist_songs(playlist)
+
+					playlist_list.append(playlist)
 
-				playlist_list.append(playlist)
+			return playlist_list
 
-		return playlist_list
+		return self._stale_while_revalidate(
+			'playlists',
+			fetch,
+			key_parts=(include_songs,),
+			max_stale=max_stale
+		)
 
 	def playlists_iter(self, *, start_token=None, page_size=250):
 		"""Get a paged iterator of library playlists.
@@ -932,13 +1557,17 @@ class MobileClient(GoogleMusicClient):
 
 		return podcast_info
 
-	def podcasts(self, *, device_id=None):
+	def podcasts(self, *, device_id=None, max_stale=None):
 		"""Get a listing of subsribed podcast series.
 
 		Paramaters:
 			device_id (str, Optional):
 				A mobile device ID.
 				Default: Use :attr:`device_id`.
+			max_stale (int, Optional):
+				Seconds past expiry a listing from :attr:`response_cache` can be returned
+				while it is refreshed in the background.
+				Default: Don't use the response cache.
 
 		Returns:
 			list: Podcast series dict.
@@ -947,11 +1576,19 @@ class MobileClient(GoogleMusicClient):
 		if device_id is None:
 			device_id = self.device_id
 
-		podcast_list = []
-		for chunk in self.podcasts_iter(device_id=device_id, page_size=49995):
-			podcast_list.extend(chunk)
+		def fetch():
+			podcast_list = []
+			for chunk in self.podcasts_iter(device_id=device_id, page_size=49995):
+				podcast_list.extend(chunk)
+
+			return podcast_list
 
-		return podcast_list
+		return self._stale_while_revalidate(
+			'podcasts',
+			fetch,
+			key_parts=(device_id,),
+			max_stale=max_stale
+		)
 
 	def podcasts_iter(self, *, device_id=None, page_size=250):
 		"""Get a paged iterator of subscribed podcast series.
@@ -1189,6 +1826,22 @@ class MobileClient(GoogleMusicClient):
 			so may not contain hits for all result types.
 		"""
 
+		if self.search_cache is not None:
+			cache_kwargs = {
+				'locale': self.locale,
+				'tier': self.tier,
+				'types': [type_ for type_, include in kwargs.items() if include],
+				'max_results': max_results,
+			}
+
+			results = self.search_cache.get_results(query, **cache_kwargs)
+
+			if results is not None:
+				return {
+					type_: list(items)
+					for type_, items in results.items()
+				}
+
 		response = self._call(
 			mc_calls.Query,
 			query,
@@ -1212,7 +1865,19 @@ class MobileClient(GoogleMusicClient):
 					)
 					results[f"{result_type}s"].append(entry[item_key])
 
-		return dict(results)
+		results = dict(results)
+
+		if self.search_cache is not None:
+			self.search_cache.set_results(
+				query,
+				{
+					type_: list(items)
+					for type_, items in results.items()
+				},
+				**cache_kwargs
+			)
+
+		return results
 
 	def search_library(self, query, *, max_results=100, **kwargs):
 		"""Search Google Music for content.
@@ -1290,14 +1955,34 @@ class MobileClient(GoogleMusicClient):
 			list: Suggested query strings.
 		"""
 
+		if self.search_cache is not None:
+			suggestions = self.search_cache.get_suggestions(
+				query,
+				locale=self.locale,
+				tier=self.tier
+			)
+
+			if suggestions is not None:
+				return list(suggestions)
+
 		response = self._call(mc_calls.QuerySuggestion, query)
 		suggested_queries = response.body.get('suggested_queries', [])
 
-		return [
+		suggestions = [
 			suggested_query['suggestion_string']
 			for suggested_query in suggested_queries
 		]
 
+		if self.search_cache is not None:
+			self.search_cache.set_suggestions(
+				query,
+				list(suggestions),
+				locale=self.locale,
+				tier=self.tier
+			)
+
+		return suggestions
+
 	def shuffle_album(
 		self,
 		album,
@@ -1325,28 +2010,13 @@ class MobileClient(GoogleMusicClient):
 			list: List of album shuffle/mix songs.
 		"""
 
-		station_info = {
-			'seed': {
-				'albumId': album['albumId'],
-				'seedType': StationSeedType.album.value,
-			},
-			'num_entries': num_songs,
-			'library_content_only': only_library,
-		}
-
-		if recently_played is not None:
-			station_info['recently_played'] = recently_played
-
-		response = self._call(
-			mc_calls.RadioStationFeed,
-			station_infos=[station_info]
+		station_info = self._station_info(
+			seed=self._album_seed(album),
+			num_songs=num_songs,
+			only_library=only_library,
+			recently_played=recently_played
 		)
-		station_feed = response.body.get('data', {}).get('stations', [])
-
-		try:
-			station = station_feed[0]
-		except IndexError:
-			station = {}
+		station = self._station_feed([station_info])[0]
 
 		return station.get('tracks', [])
 
@@ -1382,35 +2052,13 @@ class MobileClient(GoogleMusicClient):
 			list: List of artist shuffle/mix songs.
 		"""
 
-		station_info = {
-			'num_entries': num_songs,
-			'library_content_only': only_library,
-		}
-
-		if only_artist:
-			station_info['seed'] = {
-				'artistId': artist['artistId'],
-				'seedType': StationSeedType.artist_only.value,
-			}
-		else:
-			station_info['seed'] = {
-				'artistId': artist['artistId'],
-				'seedType': StationSeedType.artist_related.value,
-			}
-
-		if recently_played is not None:
-			station_info['recently_played'] = recently_played
-
-		response = self._call(
-			mc_calls.RadioStationFeed,
-			station_infos=[station_info]
+		station_info = self._station_info(
+			seed=self._artist_seed(artist, only_artist=only_artist),
+			num_songs=num_songs,
+			only_library=only_library,
+			recently_played=recently_played
 		)
-		station_feed = response.body.get('data', {}).get('stations', [])
-
-		try:
-			station = station_feed[0]
-		except IndexError:
-			station = {}
+		station = self._station_feed([station_info])[0]
 
 		return station.get('tracks', [])
 
@@ -1436,28 +2084,13 @@ class MobileClient(GoogleMusicClient):
 			list: List of genre shuffle/mix songs.
 		"""
 
-		station_info = {
-			'seed': {
-				'genreId': genre['id'],
-				'seedType': StationSeedType.genre.value,
-			},
-			'num_entries': num_songs,
-			'library_content_only': only_library,
-		}
-
-		if recently_played is not None:
-			station_info['recently_played'] = recently_played
-
-		response = self._call(
-			mc_calls.RadioStationFeed,
-			station_infos=[station_info]
+		station_info = self._station_info(
+			seed=self._genre_seed(genre),
+			num_songs=num_songs,
+			only_library=only_library,
+			recently_played=recently_played
 		)
-		station_feed = response.body.get('data', {}).get('stations', [])
-
-		try:
-			station = station_feed[0]
-		except IndexError:
-			station = {}
+		station = self._station_feed([station_info])[0]
 
 		return station.get('tracks', [])
 
@@ -1488,32 +2121,13 @@ class MobileClient(GoogleMusicClient):
 			list: List of artist shuffle/mix songs.
 		"""
 
-		station_info = {
-			'num_entries': num_songs,
-			'library_content_only': only_library,
-		}
-
-		if 'storeId' in song:
-			station_info['seed'] = {
-				'trackId': song['storeId'],
-				'seedType': StationSeedType.store_track.value,
-			}
-		else:
-			station_info['seed'] = {
-				'trackLockerId': song['id'],
-				'seedType': StationSeedType.library_track.value,
-			}
-
-		if recently_played is not None:
-			station_info['recently_played'] = recently_played
-
-		response = self._call(mc_calls.RadioStationFeed, station_infos=[station_info])
-		station_feed = response.body.get('data', {}).get('stations', [])
-
-		try:
-			station = station_feed[0]
-		except IndexError:
-			station = {}
+		station_info = self._station_info(
+			seed=self._song_seed(song),
+			num_songs=num_songs,
+			only_library=only_library,
+			recently_played=recently_played
+		)
+		station = self._station_feed([station_info])[0]
 
 		return station.get('tracks', [])
 
@@ -1709,18 +2323,27 @@ class MobileClient(GoogleMusicClient):
 			for song in songs
 		]
 
-	def songs(self):
+	def songs(self, *, max_stale=None):
 		"""Get a listing of library songs.
 
+		Parameters:
+			max_stale (int, Optional):
+				Seconds past expiry a listing from :attr:`response_cache` can be returned
+				while it is refreshed in the background.
+				Default: Don't use the response cache.
+
 		Returns:
 			list: Song dicts.
 		"""
 
-		song_list = []
-		for chunk in self.songs_iter(page_size=49995):
-			song_list.extend(chunk)
+		def fetch():
+			song_list = []
+			for chunk in self.songs_iter(page_size=49995):
+				song_list.extend(chunk)
 
-		return song_list
+			return song_list
+
+		return self._stale_while_revalidate('songs', fetch, max_stale=max_stale)
 
 	def songs_iter(self, *, page_size=250):
 		"""Get a paged iterator of library songs.
@@ -1773,27 +2396,13 @@ class MobileClient(GoogleMusicClient):
 			dict: Station information.
 		"""
 
-		station_info = {
-			'station_id': station_id,
-			'num_entries': num_songs,
-			'library_content_only': False,
-		}
-
-		if recently_played is not None:
-			station_info['recently_played'] = recently_played
-
-		response = self._call(
-			mc_calls.RadioStationFeed,
-			station_infos=[station_info]
+		station_info = self._station_info(
+			station_id=station_id,
+			num_songs=num_songs,
+			recently_played=recently_played
 		)
-		station_feed = response.body.get('data', {}).get('stations', [])
-
-		try:
-			station = station_feed[0]
-		except IndexError:
-			station = {}
 
-		return station
+		return self._station_feed([station_info])[0]
 
 	# TODO: Figure out 'radio/stationfeed'.
 	def station_feed(self, *, num_songs=25, num_stations=4):
@@ -1822,6 +2431,24 @@ class MobileClient(GoogleMusicClient):
 
 		return station_feed
 
+	def station_queue(self, station_id, **kwargs):
+		"""Get a read-ahead playback queue for a station.
+
+		The next tracks from the station are kept ready to play
+		with their stream URLs resolved and first chunk of audio buffered.
+
+		Parameters:
+			station_id (str):
+				A station ID.
+				Use 'IFL' for I'm Feeling Lucky.
+			kwargs (Optional): Keyword arguments passed to :class:`~google_music.StationQueue`.
+
+		Returns:
+			StationQueue: A station queue yielding ``(track, stream)`` tuples.
+		"""
+
+		return StationQueue(self, station_id, **kwargs)
+
 	def station_songs(self, station, *, num_songs=25, recently_played=None):
 		"""Get a listing of songs from a station.
 
@@ -1875,6 +2502,73 @@ class MobileClient(GoogleMusicClient):
 
 		return station_list
 
+	def stations_batch(
+		self,
+		items,
+		*,
+		num_songs=25,
+		only_library=False,
+		recently_played=None,
+		only_artist=False,
+		batch_size=10
+	):
+		"""Get many stations and shuffles/mixes in as few requests as possible.
+
+		Parameters:
+			items (list):
+				Station IDs and station, album, artist, genre, or song dicts to seed shuffles/mixes from.
+			num_songs (int, Optional):
+				The maximum number of songs to return from each station.
+				Default: ``25``
+			only_library (bool, Optional):
+				Only return content from library for shuffles/mixes.
+				Default: False
+			recently_played (list, Optional):
+				A list of dicts in the form of {'id': '', 'type'} where
+				``id`` is a song ID and
+				``type`` is 0 for a library song and 1 for a store song.
+			only_artist (bool, Optional):
+				If ``True``, only return songs from the artist for artist shuffles/mixes,
+				else return songs from artist and related artists.
+				Default: ``False``
+			batch_size (int, Optional):
+				The maximum number of stations to request at once.
+				Default: ``10``
+
+		Returns:
+			list: Station information dicts in the order of ``items``.
+			Stations that weren't returned are empty dicts.
+		"""
+
+		seeds = {
+			'sj#album': self._album_seed,
+			'sj#artist': functools.partial(self._artist_seed, only_artist=only_artist),
+			'sj#musicGenre': self._genre_seed,
+			'sj#track': self._song_seed,
+		}
+
+		station_infos = []
+		for item in items:
+			if isinstance(item, str):
+				station_info = self._station_info(station_id=item, num_songs=num_songs)
+			elif item.get('kind') == 'sj#radioStation':
+				station_info = self._station_info(station_id=item['id'], num_songs=num_songs)
+			elif item.get('kind') in seeds:
+				station_info = self._station_info(
+					seed=seeds[item['kind']](item),
+					num_songs=num_songs,
+					only_library=only_library
+				)
+			else:
+				raise ValueError(f"Can't create a station from {item!r}.")
+
+			if recently_played is not None:
+				station_info['recently_played'] = recently_played
+
+			station_infos.append(station_info)
+
+		return self._station_feed(station_infos, batch_size=batch_size)
+
 	def stations_iter(self, *, page_size=250):
 		"""Get a paged iterator of library stations.
 
@@ -1902,6 +2596,30 @@ class MobileClient(GoogleMusicClient):
 			if start_token is None:
 				break
 
+	def store_songs(self, song_ids, *, max_workers=8):
+		"""Get information about many store songs concurrently.
+
+		Parameters:
+			song_ids (list):
+				Store song IDs.
+				Store song IDs start with a 'T'.
+			max_workers (int, Optional):
+				Number of worker threads.
+				Default: ``8``
+
+		Returns:
+			list: Song information dicts in the order of ``song_ids``.
+			The exception raised for a song is returned in its place.
+		"""
+
+		def fetch(song_id):
+			return self._call(
+				mc_calls.FetchTrack,
+				song_id
+			).body
+
+		return self._fetch_many(fetch, song_ids, max_workers=max_workers)
+
 	def stream(
 		self,
 		item,
@@ -1942,6 +2660,13 @@ class MobileClient(GoogleMusicClient):
 		if device_id is None:
 			device_id = self.device_id
 
+		if self.audio_cache is not None:
+			cache_key = (self._item_id(item), quality)
+			audio = self.audio_cache.get(cache_key)
+
+			if audio is not None:
+				return audio
+
 		stream_url = self.stream_url(
 			item,
 			device_id=device_id,
@@ -1949,10 +2674,328 @@ class MobileClient(GoogleMusicClient):
 			session_token=session_token
 		)
 		response = self._session.request('GET', stream_url, withhold_token=True)
+		response.raise_for_status()
+
 		audio = response.content
 
+		if self.audio_cache is not None:
+			self.audio_cache.set(cache_key, audio)
+
 		return audio
 
+	async def stream_aiter(
+		self,
+		item,
+		*,
+		device_id=None,
+		quality='hi',
+		session_token=None,
+		start=None,
+		end=None
+	):
+		"""Get an asynchronous iterator over the MP3 stream of a podcast episode, library song, station_song, or store song.
+
+		The stream URL is resolved in the event loop's default executor
+		and the audio is streamed with an :class:`httpx.AsyncClient`.
+
+		Note:
+			Streaming requires a ``device_id`` from a valid, linked mobile device.
+
+		Parameters:
+			item (str):
+				A podcast episode, library song, station_song, or store song.
+				A Google Music subscription is required to stream store songs.
+			device_id (str, Optional):
+				A mobile device ID.
+				Default: Use :attr:`device_id`.
+			quality (str, Optional):
+				Stream quality is one of:
+					- ``'hi'`` (320Kbps)
+					- ``'med'`` (160Kbps)
+					- ``'low'`` (128Kbps)
+
+				Default: ``'hi'``.
+			session_token (str, Optional):
+				Session token from a station dict required for
+				unsubscribed users to stream a station song.
+			start (int, Optional):
+				Byte offset to start streaming from.
+				Default: Start of the stream.
+			end (int, Optional):
+				Inclusive byte offset to stop streaming at.
+				Default: End of the stream.
+
+		Yields:
+			bytes: Chunks of an MP3 file.
+		"""
+
+		loop = asyncio.get_event_loop()
+		stream_url = await loop.run_in_executor(
+			None,
+			functools.partial(
+				self.stream_url,
+				item,
+				device_id=device_id,
+				quality=quality,
+				session_token=session_token
+			)
+		)
+
+		async with httpx.AsyncClient(timeout=None) as client:
+			async with client.stream(
+				'GET',
+				stream_url,
+				headers={
+					**self._session.headers,
+					**self._range_header(start, end)
+				}
+			) as response:
+				response.raise_for_status()
+
+				async for chunk in response.aiter_bytes():
+					yield chunk
+
+	def stream_iter(
+		self,
+		item,
+		*,
+		device_id=None,
+		quality='hi',
+		session_token=None,
+		start=None,
+		end=None
+	):
+		"""Get an iterator over the MP3 stream of a podcast episode, library song, station_song, or store song.
+
+		Unlike :meth:`stream`, chunks are yielded as they arrive
+		rather than after the whole file is downloaded.
+
+		Note:
+			Streaming requires a ``device_id`` from a valid, linked mobile device.
+
+		Parameters:
+			item (str):
+				A podcast episode, library song, station_song, or store song.
+				A Google Music subscription is required to stream store songs.
+			device_id (str, Optional):
+				A mobile device ID.
+				Default: Use :attr:`device_id`.
+			quality (str, Optional):
+				Stream quality is one of:
+					- ``'hi'`` (320Kbps)
+					- ``'med'`` (160Kbps)
+					- ``'low'`` (128Kbps)
+
+				Default: ``'hi'``.
+			session_token (str, Optional):
+				Session token from a station dict required for
+				unsubscribed users to stream a station song.
+			start (int, Optional):
+				Byte offset to start streaming from.
+				Default: Start of the stream.
+			end (int, Optional):
+				Inclusive byte offset to stop streaming at.
+				Default: End of the stream.
+
+		Yields:
+			bytes: Chunks of an MP3 file.
+		"""
+
+		if self.audio_cache is not None:
+			cache_key = (self._item_id(item), quality)
+			audio = self.audio_cache.get(cache_key)
+
+			if audio is not None:
+				yield audio[start or 0:None if end is None else end + 1]
+
+				return
+
+		stream_url = self.stream_url(
+			item,
+			device_id=device_id,
+			quality=quality,
+			session_token=session_token
+		)
+
+		with self._session.stream(
+			'GET',
+			stream_url,
+			headers=self._range_header(start, end),
+			withhold_token=True
+		) as response:
+			response.raise_for_status()
+
+			# Only complete streams are cached.
+			if (
+				self.audio_cache is not None
+				and start is None
+				and end is None
+			):
+				with self.audio_cache.writer(cache_key) as f:
+					for chunk in response.iter_bytes():
+						f.write(chunk)
+
+						yield chunk
+			else:
+				yield from response.iter_bytes()
+
+	def stream_to(
+		self,
+		item,
+		file,
+		*,
+		device_id=None,
+		quality='hi',
+		session_token=None,
+		start=None,
+		end=None
+	):
+		"""Write the MP3 stream of a podcast episode, library song, station_song, or store song to a file object.
+
+		See :meth:`stream_iter` for parameters.
+
+		Parameters:
+			file (file object): A binary file-like object with a ``write`` method.
+
+		Returns:
+			int: Number of bytes written.
+		"""
+
+		size = 0
+		for chunk in self.stream_iter(
+			item,
+			device_id=device_id,
+			quality=quality,
+			session_token=session_token,
+			start=start,
+			end=end
+		):
+			file.write(chunk)
+			size += len(chunk)
+
+		return size
+
+	def stream_to_dir(
+		self,
+		items,
+		dirpath,
+		*,
+		device_id=None,
+		quality='hi',
+		session_token=None,
+		max_workers=8
+	):
+		"""Download the MP3 streams of many podcast episodes, library songs, station_songs, or store songs.
+
+		Stream URLs are resolved and audio is downloaded across a pool of worker threads.
+		Each item is saved as ``<item ID>.mp3`` in ``dirpath``
+		by streaming to a ``.part`` file that is moved into place once complete.
+		Items that already exist in ``dirpath`` are skipped.
+		Items with the same ID as an earlier item are skipped with reason ``'Duplicate'``.
+
+		Note:
+			Streaming requires a ``device_id`` from a valid, linked mobile device.
+
+		Parameters:
+			items (list):
+				Podcast episodes, library songs, playlist songs, station_songs, or store songs.
+			dirpath (os.PathLike or str): The directory to save audio to.
+			device_id (str, Optional):
+				A mobile device ID.
+				Default: Use :attr:`device_id`.
+			quality (str, Optional):
+				Stream quality is one of:
+					- ``'hi'`` (320Kbps)
+					- ``'med'`` (160Kbps)
+					- ``'low'`` (128Kbps)
+
+				Default: ``'hi'``.
+			session_token (str, Optional):
+				Session token from a station dict required for
+				unsubscribed users to stream a station song.
+			max_workers (int, Optional):
+				Number of worker threads.
+				Default: ``8``
+
+		Yields:
+			dict: A result dict for each item, in order of completion, with keys:
+			``'item'``, ``'filepath'``, ``'success'``, and ``'reason'``.
+		"""
+
+		dirpath = Path(dirpath)
+
+		try:
+			dirpath.mkdir(parents=True)
+		except FileExistsError:
+			pass
+
+		if device_id is None:
+			device_id = self.device_id
+
+		def download(item, filepath):
+			result = {'item': item, 'filepath': filepath}
+
+			if filepath.is_file():
+				result.update({'success': True, 'reason': 'Already exists'})
+
+				return result
+
+			part_path = filepath.with_name(f'{filepath.name}.part')
+
+			try:
+				with part_path.open('wb') as f:
+					self.stream_to(
+						item,
+						f,
+						device_id=device_id,
+						quality=quality,
+						session_token=session_token
+					)
+
+				os.replace(part_path, filepath)
+			except (OSError, ValueError, httpx.HTTPError) as e:
+				try:
+					part_path.unlink()
+				except FileNotFoundError:
+					pass
+
+				result.update({'success': False, 'reason': str(e)})
+			else:
+				result.update({'success': True, 'reason': 'Downloaded'})
+
+			return result
+
+		with ThreadPoolExecutor(max_workers=max_workers) as executor:
+			futures = []
+			duplicates = []
+			filepaths = set()
+
+			for item in items:
+				filepath = dirpath / f'{self._item_id(item)}.mp3'
+
+				# Downloads of the same item would write to the same .part file.
+				if filepath in filepaths:
+					duplicates.append(
+						{
+							'item': item,
+							'filepath': filepath,
+							'success': False,
+							'reason': 'Duplicate',
+						}
+					)
+				else:
+					filepaths.add(filepath)
+					futures.append(executor.submit(download, item, filepath))
+
+			try:
+				yield from duplicates
+
+				for future in as_completed(futures):
+					yield future.result()
+			finally:
+				for future in futures:
+					future.cancel()
+
 	def stream_url(
 		self,
 		item,
@@ -1986,6 +3029,10 @@ class MobileClient(GoogleMusicClient):
 				station['sessionToken'] as returend by :meth:`station`
 				only exists for free accounts.
 
+		Note:
+			Stream URLs are cached per item, quality, and device ID
+			until shortly before they expire.
+
 		Returns:
 			str: A URL to an MP3 file.
 		"""
@@ -1993,28 +3040,39 @@ class MobileClient(GoogleMusicClient):
 		if device_id is None:
 			device_id = self.device_id
 
+		# Stream URLs are reused until shortly before they expire.
+		# Keyed by the item's IDs rather than the call to make
+		# so cache hits don't need the subscription status from config().
+		cache_key = (
+			tuple(
+				item.get(field)
+				for field in ['episodeId', 'wentryid', 'trackId', 'storeId', 'id', 'clientId']
+			),
+			session_token if 'wentryid' in item else None,
+			quality,
+			device_id,
+		)
+		stream_url = self._stream_url_cache.get(cache_key)
+
+		if stream_url is not None:
+			return stream_url
+
 		if 'episodeId' in item:  # Podcast episode.
-			response = self._call(
+			call_args = (
 				mc_calls.PodcastEpisodeStreamURL,
 				item['episodeId'],
-				quality=quality,
-				device_id=device_id,
 			)
 		elif 'wentryid' in item:  # Free account station song.
-			response = self._call(
+			call_args = (
 				mc_calls.RadioStationTrackStreamURL,
 				item['storeId'],
 				item['wentryid'],
 				session_token,
-				quality=quality,
-				device_id=device_id,
 			)
 		elif 'trackId' in item:  # Playlist song.
-			response = self._call(
+			call_args = (
 				mc_calls.TrackStreamURL,
 				item['trackId'],
-				quality=quality,
-				device_id=device_id,
 			)
 		elif (
 			self.is_subscribed
@@ -2027,18 +3085,14 @@ class MobileClient(GoogleMusicClient):
 				)
 			)
 		):  # Store song.
-			response = self._call(
+			call_args = (
 				mc_calls.TrackStreamURL,
 				item['storeId'],
-				quality=quality,
-				device_id=device_id,
 			)
 		elif 'id' in item:  # Library song.
-			response = self._call(
+			call_args = (
 				mc_calls.TrackStreamURL,
 				item['id'],
-				quality=quality,
-				device_id=device_id,
 			)
 		else:
 			# TODO: Create an exception for not being subscribed or use a better builtin exception for this case.
@@ -2049,11 +3103,19 @@ class MobileClient(GoogleMusicClient):
 
 			raise ValueError(msg)
 
+		response = self._call(
+			*call_args,
+			quality=quality,
+			device_id=device_id,
+		)
+
 		try:
 			stream_url = response.headers['Location']
 		except KeyError:
 			stream_url = response.body['url']
 
+		self._stream_url_cache.set(cache_key, stream_url)
+
 		return stream_url
 
 	def thumbs_up_songs(self, *, library=True, store=True):
@@ -1,8 +1,13 @@
 __all__ = ['MusicManager']
 
+import os
+import random
+import re
 import socket
 import subprocess
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 from urllib.parse import unquote
 from uuid import getnode as get_mac
@@ -17,11 +22,29 @@ from google_music_proto.oauth import (
 	MUSICMANAGER_CLIENT_SECRET,
 	MUSICMANAGER_SCOPE,
 )
-from tenacity import stop_after_attempt
 
 from .base import GoogleMusicClient
+from ..scanners import ALBUM_ART_FILENAMES, scan_audio_files
 from ..token_handlers import FileTokenHandler
-from ..utils import create_mac_string
+from ..utils import create_mac_string, transcode_with_sample
+
+# Limit concurrent library downloads per account across client instances.
+_download_semaphores = {}
+_download_semaphores_lock = threading.Lock()
+
+
+def _track_info_to_dict(track_info):
+	# Only include set fields so unset ones are missing rather than defaults.
+	return {
+		field.name: value
+		for field, value in track_info.ListFields()
+	}
+
+
+def _sanitize_filename(name):
+	name = re.sub(r'[\x00-\x1f<>:"/\\|?*]', '_', name).strip().rstrip('.')
+
+	return name or '_'
 
 
 class MusicManager(GoogleMusicClient):
@@ -53,6 +76,7 @@ class MusicManager(GoogleMusicClient):
 	client_id = MUSICMANAGER_CLIENT_ID
 	client_secret = MUSICMANAGER_CLIENT_SECRET
 	oauth_scope = MUSICMANAGER_SCOPE
+	_read_calls = frozenset(['ClientState', 'ExportIDs', 'GetJobs'])
 
 	def __init__(
 		self,
@@ -100,6 +124,113 @@ class MusicManager(GoogleMusicClient):
 		self._uploader_id = uploader_id
 		self._uploader_name = uploader_name
 
+	@staticmethod
+	def _library_filepath(song, *, include_id=False):
+		artist = song.get('album_artist') or song.get('artist') or 'Unknown Artist'
+		album = song.get('album') or 'Unknown Album'
+		title = song.get('title') or song['id']
+
+		track_number = f"{song.get('track_number', 0):02}"
+		if song.get('total_disc_count', 0) > 1:
+			track_number = f"{song.get('disc_number', 0)}-{track_number}"
+
+		filename = f"{track_number} - {title}"
+		if include_id:
+			filename += f" ({song['id']})"
+
+		return Path(
+			_sanitize_filename(artist),
+			_sanitize_filename(album),
+			_sanitize_filename(f"{filename}.mp3")
+		)
+
+	@staticmethod
+	def _suggested_filename(headers, *, default=None):
+		try:
+			content_disposition = headers['Content-Disposition']
+		except KeyError:
+			if default is None:
+				raise
+
+			return default
+
+		suggested_filename = unquote(
+			content_disposition.split("filename*=UTF-8''")[-1]
+		)
+
+		return os.path.basename(suggested_filename)
+
+	def _upload_audio(
+		self,
+		song,
+		track_info,
+		server_track_id,
+		upload_url,
+		content_type,
+		*,
+		audio_file=None,
+		journal=None
+	):
+		original_content_type = track_info.original_content_type
+
+		transcode = (
+			isinstance(song, audio_metadata.WAVE)
+			or original_content_type != locker_pb2.Track.MP3
+		)
+
+		if not (
+			transcode
+			or original_content_type == locker_pb2.Track.MP3
+		):
+			# Do not upload files if transcode option set to False.
+			return {
+				'success': False,
+				'reason': 'Transcoding disabled for file type.',
+			}
+
+		# Audio may have already been transcoded along with the sample.
+		if audio_file is None:
+			if transcode:
+				audio_file = transcode_to_mp3(song, quality='320k')
+			else:
+				with open(song.filepath, 'rb') as f:
+					audio_file = f.read()
+
+		# Google Music allows a maximum file size of 300 MiB.
+		if len(audio_file) >= 300 * 1024 * 1024:
+			return {
+				'success': False,
+				'reason': 'Maximum allowed file size is 300 MiB.',
+			}
+
+		try:
+			upload_response = self._call(
+				mm_calls.ScottyAgentPut,
+				upload_url,
+				audio_file,
+				content_type=content_type,
+			).body
+		except Exception as e:  # noqa
+			return {
+				'success': False,
+				'reason': str(e),
+			}
+
+		if journal is not None:
+			journal.record(song.filepath, 'sent')
+
+		if upload_response.get('sessionStatus', {}).get('state'):
+			return {
+				'success': True,
+				'reason': 'Uploaded',
+				'song_id': server_track_id,
+			}
+		else:
+			return {
+				'success': False,
+				'reason': upload_response,  # TODO: Better error details.
+			}
+
 	@property
 	def uploader_id(self):
 		"""The uploader ID of the :class:`MusicManager` instance."""
@@ -130,12 +261,302 @@ class MusicManager(GoogleMusicClient):
 			song_id
 		)
 		audio = response.body
-		suggested_filename = unquote(
-			response.headers['Content-Disposition'].split("filename*=UTF-8''")[-1]
-		)
+		suggested_filename = self._suggested_filename(response.headers)
 
 		return (audio, suggested_filename)
 
+	def download_iter(self, song):
+		"""Download a song from a Google Music library in chunks.
+
+		The song content is streamed rather than loaded into memory.
+
+		Parameters:
+			song (dict): A song dict.
+
+		Yields:
+			bytes: Chunks of song content.
+		"""
+
+		with self._stream(
+			mm_calls.Export,
+			self.uploader_id,
+			song['id']
+		) as response:
+			response.raise_for_status()
+
+			yield from response.iter_bytes()
+
+	def download_to(self, song, filepath, *, retries=5):
+		"""Download a song from a Google Music library to a file.
+
+		The song content is streamed to a ``.part`` file and
+		moved to its final path once complete.
+		Interrupted downloads are resumed with HTTP Range requests,
+		including from a ``.part`` file left by a previous call.
+
+		Parameters:
+			song (dict): A song dict.
+			filepath (os.PathLike or str):
+				The path to download the song to.
+				If an existing directory, the song is downloaded into it
+				using the suggested filename.
+			retries (int, Optional):
+				Number of times to resume after a network or server error.
+				Default: ``5``
+
+		Returns:
+			Path: The path of the downloaded song.
+		"""
+
+		song_id = song['id']
+		filepath = Path(filepath)
+
+		if filepath.is_dir():
+			part_path = filepath / f'{song_id}.part'
+		else:
+			part_path = filepath.with_name(f'{filepath.name}.part')
+
+		attempts = 0
+
+		while True:
+			try:
+				offset = part_path.stat().st_size
+			except FileNotFoundError:
+				offset = 0
+
+			if offset:
+				headers = {'Range': f'bytes={offset}-'}
+			else:
+				headers = None
+
+			status_code = None
+
+			try:
+				with self._stream(
+					mm_calls.Export,
+					self.uploader_id,
+					song_id,
+					headers=headers
+				) as response:
+					status_code = response.status_code
+
+					if filepath.is_dir():
+						download_path = filepath / self._suggested_filename(
+							response.headers,
+							default=f'{song_id}.mp3'
+						)
+					else:
+						download_path = filepath
+
+					if status_code == 416:  # Range not satisfiable.
+						content_range = re.match(
+							r'bytes \*/(\d+)',
+							response.headers.get('Content-Range', '')
+						)
+						total_size = int(content_range.group(1)) if content_range else song.get('track_size')
+
+						# The .part file is already complete.
+						if offset == total_size:
+							break
+
+						part_path.unlink()
+						continue
+
+					response.raise_for_status()
+
+					mode = 'wb'
+					if status_code == 206:
+						content_range = re.match(
+							r'bytes (\d+)-',
+							response.headers.get('Content-Range', '')
+						)
+						range_start = int(content_range.group(1)) if content_range else None
+
+						if range_start == offset:
+							mode = 'ab'
+						elif range_start != 0:  # Misaligned range; start over.
+							attempts += 1
+
+							if attempts > retries:
+								raise ValueError(
+									f"Expected content range starting at {offset}, got {range_start}."
+								)
+
+							try:
+								part_path.unlink()
+							except FileNotFoundError:
+								pass
+
+							continue
+
+					with part_path.open(mode) as f:
+						for chunk in response.iter_bytes():
+							f.write(chunk)
+			except httpx.HTTPError:
+				attempts += 1
+
+				# Only retry network errors and server errors.
+				if (
+					attempts > retries
+					or (status_code is not None and 400 <= status_code < 500)
+				):
+					raise
+
+				time.sleep(min(0.5 * 2 ** attempts, 10) * random.uniform(0.5, 1))
+			else:
+				break
+
+		os.replace(part_path, download_path)
+
+		return download_path
+
+	def download_library(
+		self,
+		dirpath,
+		*,
+		uploaded=True,
+		purchased=True,
+		max_workers=4,
+		max_account_downloads=4
+	):
+		"""Download all songs from a Google Music library.
+
+		Song listings are paged while songs are downloaded
+		with :meth:`download_to` across a pool of worker threads.
+		At most ``max_account_downloads`` songs are downloaded at a time per account,
+		including across :class:`MusicManager` instances.
+
+		Songs are saved as ``<artist>/<album>/<track number> - <title>.mp3``.
+		Songs that would be saved to the same path as another song
+		have their song ID appended to the filename.
+		Songs that already exist locally with the listed size are skipped.
+
+		Parameters:
+			dirpath (os.PathLike or str): The directory to download songs to.
+			uploaded (bool, Optional):
+				Download uploaded songs.
+				Default: ``True``
+			purchased (bool, Optional):
+				Download purchased songs.
+				Default: ``True``
+			max_workers (int, Optional):
+				Number of worker threads.
+				Default: ``4``
+			max_account_downloads (int, Optional):
+				Maximum number of songs downloaded at a time for the account,
+				shared by calls with the same username and uploader ID.
+				The limit of the first call for an account applies to later calls.
+				Default: ``4``
+
+		Yields:
+			dict: A result dict for each song with keys:
+			``'song_id'``, ``'filepath'``, ``'success'``, ``'reason'``,
+			``'bytes'``, ``'elapsed'``, and ``'throughput'``
+			(bytes per second downloaded since start).
+		"""
+
+		if not uploaded and not purchased:
+			raise ValueError("'uploaded' and 'purchased' cannot both be False.")
+
+		dirpath = Path(dirpath)
+
+		with _download_semaphores_lock:
+			semaphore = _download_semaphores.setdefault(
+				(self.username, self.uploader_id),
+				threading.BoundedSemaphore(max_account_downloads)
+			)
+
+		if uploaded and not purchased:
+			song_chunks = [self.songs(uploaded=True, purchased=False)]
+		else:
+			song_chunks = self.songs_iter(export_type=1 if uploaded else 2)
+
+		def download_song(song, filepath):
+			result = {
+				'song_id': song['id'],
+				'filepath': filepath,
+				'bytes': 0,
+				'elapsed': 0,
+			}
+
+			try:
+				if filepath.stat().st_size == song.get('track_size'):
+					result.update({'success': True, 'reason': 'Already exists'})
+
+					return result
+			except OSError:
+				pass
+
+			with semaphore:
+				start_time = time.monotonic()
+
+				try:
+					filepath.parent.mkdir(parents=True, exist_ok=True)
+					self.download_to(song, filepath)
+				except (OSError, ValueError, httpx.HTTPError) as e:
+					result.update({'success': False, 'reason': str(e)})
+				else:
+					result.update(
+						{
+							'success': True,
+							'reason': 'Downloaded',
+							'bytes': filepath.stat().st_size,
+						}
+					)
+
+				result['elapsed'] = time.monotonic() - start_time
+
+			return result
+
+		total_bytes = 0
+		start_time = time.monotonic()
+
+		def report(future):
+			nonlocal total_bytes
+
+			result = future.result()
+			total_bytes += result['bytes']
+			result['throughput'] = total_bytes / max(time.monotonic() - start_time, 1e-9)
+
+			return result
+
+		# Downloads to the same path would write to the same .part file.
+		filepath_song_ids = {}
+
+		with ThreadPoolExecutor(max_workers=max_workers) as executor:
+			futures = set()
+
+			try:
+				for chunk in song_chunks:
+					for song in chunk:
+						filepath = dirpath / self._library_filepath(song)
+
+						if filepath_song_ids.get(filepath, song['id']) != song['id']:
+							filepath = dirpath / self._library_filepath(song, include_id=True)
+
+						if filepath in filepath_song_ids:  # Song listed more than once.
+							continue
+
+						filepath_song_ids[filepath] = song['id']
+
+						# Only page ahead of downloads by a bounded amount.
+						if len(futures) >= max_workers * 2:
+							done, futures = wait(futures, return_when=FIRST_COMPLETED)
+
+							for future in done:
+								yield report(future)
+
+						futures.add(executor.submit(download_song, song, filepath))
+
+				while futures:
+					done, futures = wait(futures, return_when=FIRST_COMPLETED)
+
+					for future in done:
+						yield report(future)
+			finally:
+				for future in futures:
+					future.cancel()
+
 	def quota(self):
 		"""Get the uploaded track count and allowance.
 
@@ -170,20 +591,32 @@ class MusicManager(GoogleMusicClient):
 			for chunk in self.songs_iter(export_type=2):
 				song_list.extend(chunk)
 		elif uploaded:
-			purchased_songs = []
-			for chunk in self.songs_iter(export_type=2):
-				purchased_songs.extend(chunk)
+			def get_songs(export_type):
+				return [
+					song
+					for chunk in self.songs_iter(export_type=export_type)
+					for song in chunk
+				]
+
+			# Page both listings concurrently.
+			with ThreadPoolExecutor(max_workers=2) as executor:
+				all_songs = executor.submit(get_songs, 1)
+				purchased_songs = executor.submit(get_songs, 2)
 
-			song_list = [
-				song
-				for chunk in self.songs_iter(export_type=1)
-				for song in chunk
-				if song not in purchased_songs
-			]
+				purchased_ids = {
+					song['id']
+					for song in purchased_songs.result()
+				}
+
+				song_list = [
+					song
+					for song in all_songs.result()
+					if song['id'] not in purchased_ids
+				]
 
 		return song_list
 
-	def songs_iter(self, *, continuation_token=None, export_type=1):
+	def songs_iter(self, *, continuation_token=None, export_type=1, raw=False):
 		"""Get a paged iterator of Music Library songs.
 
 		Parameters:
@@ -195,17 +628,15 @@ class MusicManager(GoogleMusicClient):
 				1 for all tracks,
 				2 for promotional and purchased.
 				Default: ``1``
+			raw (bool, Optional):
+				Yield the ``download_pb2.DownloadTrackInfo`` messages
+				instead of converting them to dicts.
+				Default: ``False``
 
 		Yields:
 			list: Song dicts.
 		"""
 
-		def track_info_to_dict(track_info):
-			return {
-				field.name: value
-				for field, value in track_info.ListFields()
-			}
-
 		while True:
 			response = self._call(
 				mm_calls.ExportIDs,
@@ -214,10 +645,13 @@ class MusicManager(GoogleMusicClient):
 				export_type=export_type,
 			)
 
-			items = [
-				track_info_to_dict(track_info)
-				for track_info in response.body.download_track_info
-			]
+			if raw:
+				items = list(response.body.download_track_info)
+			else:
+				items = [
+					_track_info_to_dict(track_info)
+					for track_info in response.body.download_track_info
+				]
 
 			if items:
 				yield items
@@ -229,31 +663,99 @@ class MusicManager(GoogleMusicClient):
 
 	# TODO: Is there a better return value?
 	# TODO: Can more of this code be moved into calls and still leave viable control flow?
-	def upload(self, song, *, album_art_path=None, no_sample=False):
+	def upload(
+		self,
+		song,
+		*,
+		album_art=None,
+		album_art_path=None,
+		no_sample=False,
+		transcode_once=False,
+		manifest=None,
+		metadata_cache=None,
+		journal=None
+	):
 		"""Upload a song to a Google Music library.
 
 		Parameters:
 			song (os.PathLike or str or audio_metadata.Format):
 				The path to an audio file or
 				an instance of :class:`audio_metadata.Format`.
+			album_art (bytes, Optional):
+				The binary data of external album art.
+				Takes precedence over ``album_art_path``.
 			album_art_path (os.PathLike or str, Optional):
 				The relative filename or absolute filepath to external album art.
 			no_sample(bool, Optional):
 				Don't generate an audio sample from song;
 				send empty audio sample.
 				Default: Create an audio sample using ffmpeg/avconv.
+			transcode_once (bool, Optional):
+				When a sample is requested for a song that requires transcoding,
+				transcode the song and generate the sample in a single ffmpeg/avconv pass.
+				The transcoded audio is kept for the upload.
+				This saves decoding the song twice when the upload is requested,
+				at the cost of a full transcode when the song is matched instead.
+				Default: ``False``
+			manifest (:class:`~google_music.UploadManifest`, Optional):
+				An upload manifest to check before contacting Google Music.
+				Unchanged files, or files with the same audio, found in the manifest
+				are skipped with reason ``'ALREADY_EXISTS'``.
+				Songs in the library after upload are added to the manifest.
+			metadata_cache (:class:`~google_music.MetadataCache`, Optional):
+				A metadata cache used to get the locker track of unchanged files
+				without parsing them. Audio metadata is then only loaded
+				if a sample or upload is requested.
+			journal (:class:`~google_music.UploadJournal`, Optional):
+				An upload journal to record upload stages to.
+				Files confirmed in the journal are skipped with their recorded result.
+				Files with an upload session URL in the journal
+				are sent to that URL without negotiating again,
+				falling back to a full upload if that fails.
 
 		Returns:
 			dict: A result dict with keys: ``'filepath'``, ``'success'``, ``'reason'``, and ``'song_id'`` (if successful).
 		"""
 
-		if not isinstance(song, audio_metadata.Format):
-			try:
-				song = audio_metadata.load(song)
-			except audio_metadata.UnsupportedFormat:
-				raise ValueError("'song' is not of a supported format.")
+		if isinstance(song, audio_metadata.Format):
+			filepath = Path(song.filepath)
+		else:
+			filepath = Path(song)
 
-		if album_art_path:
+		if manifest is not None:
+			entry = manifest.get(filepath)
+
+			if entry is not None:
+				return {
+					'filepath': filepath,
+					'success': False,
+					'reason': 'ALREADY_EXISTS',
+					'song_id': entry['server_track_id'],
+				}
+
+		if journal is not None:
+			journal_entry = journal.get(filepath)
+
+			if (
+				journal_entry is not None
+				and journal_entry['stage'] == 'confirmed'
+			):
+				result = {
+					'filepath': filepath,
+					'success': journal_entry['success'],
+					'reason': journal_entry['reason'],
+				}
+
+				if 'song_id' in journal_entry:
+					result['song_id'] = journal_entry['song_id']
+
+				return result
+		else:
+			journal_entry = None
+
+		if album_art:
+			external_art = album_art
+		elif album_art_path:
 			album_art_path = Path(album_art_path).resolve()
 
 			if album_art_path.is_file():
@@ -264,9 +766,95 @@ class MusicManager(GoogleMusicClient):
 		else:
 			external_art = None
 
-		result = {'filepath': Path(song.filepath)}
+		result = {'filepath': filepath}
+
+		if metadata_cache is not None:
+			track_info = metadata_cache.get(filepath)
+		else:
+			track_info = None
+
+		if track_info is None:
+			if not isinstance(song, audio_metadata.Format):
+				try:
+					song = audio_metadata.load(song)
+				except audio_metadata.UnsupportedFormat:
+					raise ValueError("'song' is not of a supported format.")
+
+			track_info = mm_calls.Metadata.get_track_info(song)
+
+			if metadata_cache is not None:
+				metadata_cache.set(filepath, track_info)
+
+		if manifest is not None:
+			entry = manifest.get_by_client_id(track_info.client_id)
+
+			if entry is not None:
+				manifest.add(
+					filepath,
+					track_info.client_id,
+					entry['server_track_id'],
+					'ALREADY_EXISTS'
+				)
+
+				result.update(
+					{
+						'success': False,
+						'reason': 'ALREADY_EXISTS',
+						'song_id': entry['server_track_id'],
+					}
+				)
+
+				return result
+
+		if (
+			journal_entry is not None
+			and journal_entry['stage'] == 'session'
+		):
+			if not isinstance(song, audio_metadata.Format):
+				song = audio_metadata.load(song)
+
+			self._call(
+				mm_calls.UploadState,
+				self.uploader_id,
+				'START'
+			)
+
+			try:
+				result.update(
+					self._upload_audio(
+						song,
+						track_info,
+						journal_entry['server_track_id'],
+						journal_entry['upload_url'],
+						journal_entry['content_type'],
+						journal=journal,
+					)
+				)
+			finally:
+				self._call(mm_calls.UploadState, self.uploader_id, 'STOPPED')
+
+			if result['success']:
+				journal.record(
+					filepath,
+					'confirmed',
+					success=True,
+					reason=result['reason'],
+					song_id=result['song_id'],
+				)
+
+				if manifest is not None:
+					manifest.add(
+						filepath,
+						track_info.client_id,
+						result['song_id'],
+						result['reason']
+					)
+
+				return result
+
+			# The upload session may have expired; start over.
+			result = {'filepath': filepath}
 
-		track_info = mm_calls.Metadata.get_track_info(song)
 		response = self._call(
 			mm_calls.Metadata,
 			self.uploader_id, [track_info]
@@ -274,17 +862,50 @@ class MusicManager(GoogleMusicClient):
 
 		metadata_response = response.body.metadata_response
 
+		original_content_type = track_info.original_content_type
+		transcode = (
+			isinstance(song, audio_metadata.WAVE)
+			or original_content_type != locker_pb2.Track.MP3
+		)
+		audio_file = None
+
 		if metadata_response.signed_challenge_info:  # Sample requested.
 			sample_request = metadata_response.signed_challenge_info[0]
 
+			if not isinstance(song, audio_metadata.Format):
+				song = audio_metadata.load(song)
+
 			try:
-				track_sample = mm_calls.Sample.generate_sample(
-					song,
-					track_info,
-					sample_request,
-					external_art=external_art,
-					no_sample=no_sample,
-				)
+				if (
+					transcode_once
+					and transcode
+					and not no_sample
+				):
+					audio_file, sample = transcode_with_sample(
+						song,
+						slice_start=sample_request.challenge_info.start_millis // 1000,
+						slice_duration=sample_request.challenge_info.duration_millis // 1000,
+						quality='320k',
+						sample_quality='128k',
+					)
+
+					track_sample = mm_calls.Sample.generate_sample(
+						song,
+						track_info,
+						sample_request,
+						external_art=external_art,
+						no_sample=True,
+					)
+					track_sample.sample = sample
+				else:
+					track_sample = mm_calls.Sample.generate_sample(
+						song,
+						track_info,
+						sample_request,
+						external_art=external_art,
+						no_sample=no_sample,
+					)
+
 				response = self._call(
 					mm_calls.Sample,
 					self.uploader_id,
@@ -300,6 +921,14 @@ class MusicManager(GoogleMusicClient):
 
 		response_code = track_sample_response.response_code
 
+		if journal is not None:
+			journal.record(
+				filepath,
+				'negotiated',
+				server_track_id=track_sample_response.server_track_id,
+				response_code=response_code,
+			)
+
 		if response_code == upload_pb2.TrackSampleResponse.MATCHED:
 			result.update(
 				{
@@ -311,139 +940,105 @@ class MusicManager(GoogleMusicClient):
 		elif response_code == upload_pb2.TrackSampleResponse.UPLOAD_REQUESTED:
 			server_track_id = track_sample_response.server_track_id
 
+			if not isinstance(song, audio_metadata.Format):
+				song = audio_metadata.load(song)
+
 			self._call(
 				mm_calls.UploadState,
 				self.uploader_id,
 				'START'
 			)
 
-			attempts = 0
-			should_retry = True
-
-			while should_retry and attempts <= 10:
-				try:
-					# Call with tenacity.retry_with to disable automatic retries.
-					response = self._call.retry_with(stop=stop_after_attempt(1))(
-						self,
-						mm_calls.ScottyAgentPost,
-						self.uploader_id,
-						server_track_id,
-						track_info,
-						song,
-						external_art=external_art,
-						total_song_count=1,
-						total_uploaded_count=0,
-					)
-				except httpx.HTTPError as e:
-					should_retry = True
-					reason = e.response
-				else:
-					session_response = response.body
-
-					if 'sessionStatus' in session_response:
-						break
+			try:
+				attempts = 0
+				should_retry = True
 
+				while should_retry and attempts <= 10:
 					try:
-						# WHY, GOOGLE?! WHY???????????
-						status_code = session_response['errorMessage']['additionalInfo'][
-							'uploader_service.GoogleRupioAdditionalInfo'
-						]['completionInfo']['customerSpecificInfo']['ResponseCode']
-					except KeyError:
-						status_code = None
-
-					if status_code == 503:  # Upload server still syncing.
+						# Disable automatic retries; this loop handles them.
+						response = self._call(
+							mm_calls.ScottyAgentPost,
+							self.uploader_id,
+							server_track_id,
+							track_info,
+							song,
+							external_art=external_art,
+							total_song_count=1,
+							total_uploaded_count=0,
+							retries=False,
+						)
+					except httpx.HTTPError as e:
 						should_retry = True
-						reason = "Server syncing"
-					elif status_code == 200:  # Song is already uploaded.
-						should_retry = False
-						reason = "Already uploaded"
-					elif status_code == 404:  # Rejected.
-						should_retry = False
-						reason = "Rejected"
+						reason = e.response
 					else:
-						should_retry = True
-						reason = "Unkown error"
-				finally:
-					attempts += 1
-					time.sleep(2)  # Give the server time to sync.
-			else:
-				result.update(
-					{
-						'success': False,
-						'reason': f'Could not get upload session: {reason}',
-					}
-				)
+						session_response = response.body
 
-			if 'success' not in result:
-				transfer = session_response['sessionStatus']['externalFieldTransfers'][0]
+						if 'sessionStatus' in session_response:
+							break
 
-				upload_url = transfer['putInfo']['url']
-				content_type = transfer.get('content_type', 'audio/mpeg')
-				original_content_type = track_info.original_content_type
+						try:
+							# WHY, GOOGLE?! WHY???????????
+							status_code = session_response['errorMessage']['additionalInfo'][
+								'uploader_service.GoogleRupioAdditionalInfo'
+							]['completionInfo']['customerSpecificInfo']['ResponseCode']
+						except KeyError:
+							status_code = None
+
+						if status_code == 503:  # Upload server still syncing.
+							should_retry = True
+							reason = "Server syncing"
+						elif status_code == 200:  # Song is already uploaded.
+							should_retry = False
+							reason = "Already uploaded"
+						elif status_code == 404:  # Rejected.
+							should_retry = False
+							reason = "Rejected"
+						else:
+							should_retry = True
+							reason = "Unkown error"
 
-				transcode = (
-					isinstance(song, audio_metadata.WAVE)
-					or original_content_type != locker_pb2.Track.MP3
-				)
+					attempts += 1
 
-				if (
-					transcode
-					or original_content_type == locker_pb2.Track.MP3
-				):
-					if transcode:
-						audio_file = transcode_to_mp3(song, quality='320k')
-					else:
-						with open(song.filepath, 'rb') as f:
-							audio_file = f.read()
-
-					# Google Music allows a maximum file size of 300 MiB.
-					if len(audio_file) >= 300 * 1024 * 1024:
-						result.update(
-							{
-								'success': False,
-								'reason': 'Maximum allowed file size is 300 MiB.',
-							}
+					if should_retry and attempts <= 10:
+						# Give the server time to sync.
+						# Back off exponentially with jitter to not retry in lockstep.
+						time.sleep(
+							min(0.5 * 2 ** attempts, 10) * random.uniform(0.5, 1)
 						)
-					else:
-						try:
-							upload_response = self._call(
-								mm_calls.ScottyAgentPut,
-								upload_url,
-								audio_file,
-								content_type=content_type,
-							).body
-						except Exception as e:  # noqa
-							result.update(
-								{
-									'success': False,
-									'reason': str(e),
-								}
-							)
-
-						if upload_response.get('sessionStatus', {}).get('state'):
-							result.update(
-								{
-									'success': True,
-									'reason': 'Uploaded',
-									'song_id': track_sample_response.server_track_id,
-								}
-							)
-						else:
-							result.update(
-								{
-									'success': False,
-									'reason': upload_response,  # TODO: Better error details.
-								}
-							)
 				else:
-					# Do not upload files if transcode option set to False.
 					result.update(
 						{
 							'success': False,
-							'reason': 'Transcoding disabled for file type.',
+							'reason': f'Could not get upload session: {reason}',
 						}
 					)
 
+				if 'success' not in result:
+					transfer = session_response['sessionStatus']['externalFieldTransfers'][0]
+
+					upload_url = transfer['putInfo']['url']
+					content_type = transfer.get('content_type', 'audio/mpeg')
+
+					if journal is not None:
+						journal.record(
+							filepath,
+							'session',
+							upload_url=upload_url,
+							content_type=content_type,
+						)
+
+					result.update(
+						self._upload_audio(
+							song,
+							track_info,
+							server_track_id,
+							upload_url,
+							content_type,
+							audio_file=audio_file,
+							journal=journal,
+						)
+					)
+			finally:
 				self._call(mm_calls.UploadState, self.uploader_id, 'STOPPED')
 		else:
 			response_codes = upload_pb2._TRACKSAMPLERESPONSE.enum_types[0]
@@ -463,4 +1058,80 @@ class MusicManager(GoogleMusicClient):
 			if response_type == 'ALREADY_EXISTS':
 				result['song_id'] = track_sample_response.server_track_id
 
+		if (
+			manifest is not None
+			and 'song_id' in result
+		):
+			manifest.add(
+				filepath,
+				track_info.client_id,
+				result['song_id'],
+				result['reason']
+			)
+
+		if journal is not None:
+			if 'song_id' in result:
+				journal.record(
+					filepath,
+					'confirmed',
+					success=result['success'],
+					reason=result['reason'],
+					song_id=result['song_id'],
+				)
+			else:
+				journal.record(
+					filepath,
+					'failed',
+					reason=str(result['reason']),
+				)
+
 		return result
+
+	def upload_paths(
+		self,
+		paths,
+		*,
+		album_art_filenames=ALBUM_ART_FILENAMES,
+		max_workers=4,
+		max_queued=1000,
+		**kwargs
+	):
+		"""Upload songs from files and directories to a Google Music library.
+
+		Directories are scanned recursively in background threads
+		while songs are uploaded, one at a time, as they are found.
+		External album art is read once per directory.
+
+		Parameters:
+			paths (list):
+				Paths to audio files or directories as :class:`os.PathLike` or str.
+			album_art_filenames (list, Optional):
+				Filenames of external album art in order of preference.
+				Default: :data:`~google_music.scanners.ALBUM_ART_FILENAMES`
+			max_workers (int, Optional):
+				Number of threads scanning directories.
+				Default: ``4``
+			max_queued (int, Optional):
+				Maximum number of found files waiting to be uploaded.
+				Default: ``1000``
+			kwargs (Optional):
+				Keyword arguments to pass to :meth:`upload`.
+
+		Yields:
+			dict: A result dict for each song as returned by :meth:`upload`.
+		"""
+
+		for filepath, album_art in scan_audio_files(
+			paths,
+			album_art_filenames=album_art_filenames,
+			max_workers=max_workers,
+			max_queued=max_queued,
+		):
+			try:
+				yield self.upload(filepath, album_art=album_art, **kwargs)
+			except (OSError, ValueError, subprocess.CalledProcessError, httpx.HTTPError) as e:
+				yield {
+					'filepath': Path(filepath),
+					'success': False,
+					'reason': str(e),
+				}
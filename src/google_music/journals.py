@@ -0,0 +1,165 @@
+__all__ = [
+	'UploadJournal',
+]
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+
+class UploadJournal:
+	"""An append-only journal of per-file upload stages for an upload job.
+
+	Each stage transition is appended as a JSON line and flushed immediately,
+	so a job that dies can be restarted with the same journal to
+	skip completed files and resume in-progress ones.
+	Entries are only returned while the file's size and modification time
+	are unchanged since the last stage transition.
+
+	Stages, in order:
+		- ``'negotiated'``: Metadata/sample response received with a ``server_track_id``.
+		- ``'session'``: Upload session URL obtained.
+		- ``'sent'``: Audio sent to the upload URL.
+		- ``'confirmed'``: Song is in the library.
+		- ``'failed'``: Upload did not succeed; the file is retried from the start.
+
+	Parameters:
+		filepath (os.PathLike or str): The path of the journal file.
+	"""
+
+	stages = ('negotiated', 'session', 'sent', 'confirmed', 'failed')
+
+	def __init__(self, filepath):
+		self.filepath = Path(filepath)
+		self._lock = threading.Lock()
+		self._entries = {}
+
+		try:
+			self.filepath.parent.mkdir(parents=True)
+		except FileExistsError:
+			pass
+
+		if self.filepath.is_file():
+			with self.filepath.open('r', encoding='utf-8') as f:
+				for line in f:
+					try:
+						record = json.loads(line)
+					except json.JSONDecodeError:  # Partially written line from a crash.
+						continue
+
+					self._apply(record)
+
+		self._file = self.filepath.open('a', encoding='utf-8')
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *args):
+		self.close()
+
+	def __repr__(self):
+		return f"UploadJournal(filepath={str(self.filepath)!r})"
+
+	def _apply(self, record):
+		filepath = record['filepath']
+
+		if record['stage'] == 'negotiated':
+			self._entries[filepath] = record
+		else:
+			self._entries[filepath] = {**self._entries.get(filepath, {}), **record}
+
+	def close(self):
+		"""Close the journal file."""
+
+		with self._lock:
+			self._file.close()
+
+	def completed(self):
+		"""Get the filepaths of files with a confirmed upload.
+
+		Returns:
+			list: Absolute filepaths.
+		"""
+
+		with self._lock:
+			return [
+				filepath
+				for filepath, entry in self._entries.items()
+				if entry['stage'] == 'confirmed'
+			]
+
+	def get(self, filepath):
+		"""Get the latest state of a file if it hasn't changed since being recorded.
+
+		Parameters:
+			filepath (os.PathLike or str): The path to an audio file.
+
+		Returns:
+			dict: The data recorded for the current upload attempt with the latest ``'stage'``,
+			or ``None`` if the file isn't in the journal or has changed.
+		"""
+
+		filepath = os.path.abspath(filepath)
+
+		try:
+			stat = os.stat(filepath)
+		except OSError:
+			return None
+
+		with self._lock:
+			entry = self._entries.get(filepath)
+
+		if (
+			entry is None
+			or entry.get('size') != stat.st_size
+			or entry.get('mtime_ns') != stat.st_mtime_ns
+		):
+			return None
+
+		return dict(entry)
+
+	def in_progress(self):
+		"""Get the filepaths of files with an unfinished upload.
+
+		Returns:
+			list: Absolute filepaths.
+		"""
+
+		with self._lock:
+			return [
+				filepath
+				for filepath, entry in self._entries.items()
+				if entry['stage'] not in ['confirmed', 'failed']
+			]
+
+	def record(self, filepath, stage, **data):
+		"""Append a stage transition for a file.
+
+		Parameters:
+			filepath (os.PathLike or str): The path to an audio file.
+			stage (str): One of :attr:`stages`.
+			data (Optional): JSON-serializable data to store with the stage.
+		"""
+
+		if stage not in self.stages:
+			raise ValueError(f"'stage' must be one of {self.stages}.")
+
+		filepath = os.path.abspath(filepath)
+		stat = os.stat(filepath)
+
+		record = {
+			**data,
+			'filepath': filepath,
+			'stage': stage,
+			'size': stat.st_size,
+			'mtime_ns': stat.st_mtime_ns,
+			'time': time.time(),
+		}
+
+		with self._lock:
+			self._file.write(json.dumps(record) + '\n')
+			self._file.flush()
+
+			self._apply(record)
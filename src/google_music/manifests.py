@@ -0,0 +1,179 @@
+__all__ = [
+	'UploadManifest',
+]
+
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+import appdirs
+
+from .__about__ import __author__, __title__
+
+MANIFEST_DIR = Path(appdirs.user_data_dir(__title__, __author__))
+
+
+class UploadManifest:
+	"""A persistent record of files uploaded to a Google Music library.
+
+	Entries are keyed by absolute filepath and only returned
+	while the file's size and modification time are unchanged.
+	The client ID (a hash of the audio content) of each file is also stored
+	so moved or retagged files can be recognized without a network call.
+
+	Note:
+		The manifest is not synchronized with the Google Music library.
+		Songs deleted from the library after being recorded must be removed
+		with :meth:`remove` to be uploaded again.
+
+	Parameters:
+		filepath (os.PathLike or str, Optional):
+			The path of the manifest database.
+			Default: ``upload_manifest.sqlite`` in the user data directory for ``username``.
+		username (str, Optional):
+			Your Google Music username.
+			Used to store manifests for multiple accounts separately.
+	"""
+
+	def __init__(self, filepath=None, *, username=''):
+		if filepath is None:
+			filepath = MANIFEST_DIR / username / 'upload_manifest.sqlite'
+
+		self.filepath = Path(filepath)
+
+		try:
+			self.filepath.parent.mkdir(parents=True)
+		except FileExistsError:
+			pass
+
+		self._lock = threading.Lock()
+		self._connection = sqlite3.connect(str(self.filepath), check_same_thread=False)
+
+		with self._connection:
+			self._connection.execute(
+				"CREATE TABLE IF NOT EXISTS uploads ("
+				"filepath TEXT PRIMARY KEY, "
+				"size INTEGER NOT NULL, "
+				"mtime_ns INTEGER NOT NULL, "
+				"client_id TEXT NOT NULL, "
+				"server_track_id TEXT NOT NULL, "
+				"reason TEXT NOT NULL"
+				")"
+			)
+			self._connection.execute(
+				"CREATE INDEX IF NOT EXISTS uploads_client_id ON uploads (client_id)"
+			)
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *args):
+		self.close()
+
+	def __repr__(self):
+		return f"UploadManifest(filepath={str(self.filepath)!r})"
+
+	@staticmethod
+	def _entry(row):
+		if row is None:
+			return None
+
+		return dict(
+			zip(
+				['filepath', 'size', 'mtime_ns', 'client_id', 'server_track_id', 'reason'],
+				row
+			)
+		)
+
+	def add(self, filepath, client_id, server_track_id, reason):
+		"""Record an uploaded file.
+
+		Parameters:
+			filepath (os.PathLike or str): The path to an audio file.
+			client_id (str): The client ID of the audio file.
+			server_track_id (str): The song ID of the audio file in the Google Music library.
+			reason (str): The reason given in the result of the upload.
+		"""
+
+		filepath = os.path.abspath(filepath)
+		stat = os.stat(filepath)
+
+		with self._lock, self._connection:
+			self._connection.execute(
+				"INSERT OR REPLACE INTO uploads VALUES (?, ?, ?, ?, ?, ?)",
+				(filepath, stat.st_size, stat.st_mtime_ns, client_id, server_track_id, reason)
+			)
+
+	def close(self):
+		"""Close the manifest database."""
+
+		with self._lock:
+			self._connection.close()
+
+	def get(self, filepath):
+		"""Get the entry for a file if it hasn't changed since being recorded.
+
+		Parameters:
+			filepath (os.PathLike or str): The path to an audio file.
+
+		Returns:
+			dict: A manifest entry, or ``None`` if not found or the file has changed.
+		"""
+
+		filepath = os.path.abspath(filepath)
+
+		try:
+			stat = os.stat(filepath)
+		except OSError:
+			return None
+
+		with self._lock:
+			row = self._connection.execute(
+				"SELECT * FROM uploads WHERE filepath = ?",
+				(filepath,)
+			).fetchone()
+
+		entry = self._entry(row)
+
+		if (
+			entry is None
+			or entry['size'] != stat.st_size
+			or entry['mtime_ns'] != stat.st_mtime_ns
+		):
+			return None
+
+		return entry
+
+	def get_by_client_id(self, client_id):
+		"""Get an entry for any file with the given client ID.
+
+		Parameters:
+			client_id (str): The client ID of an audio file.
+
+		Returns:
+			dict: A manifest entry, or ``None`` if not found.
+		"""
+
+		with self._lock:
+			row = self._connection.execute(
+				"SELECT * FROM uploads WHERE client_id = ?",
+				(client_id,)
+			).fetchone()
+
+		return self._entry(row)
+
+	def remove(self, filepath):
+		"""Remove the entry for a file.
+
+		Parameters:
+			filepath (os.PathLike or str): The path to an audio file.
+		"""
+
+		filepath = os.path.abspath(filepath)
+
+		with self._lock, self._connection:
+			self._connection.execute(
+				"DELETE FROM uploads WHERE filepath = ?",
+				(filepath,)
+			)
@@ -0,0 +1,222 @@
+__all__ = [
+	'ALBUM_ART_FILENAMES',
+	'AUDIO_EXTENSIONS',
+	'scan_audio_files',
+]
+
+import os
+import queue
+import threading
+
+# Formats supported by both audio-metadata and Google Music uploads.
+AUDIO_EXTENSIONS = frozenset(
+	['.flac', '.mp3', '.oga', '.ogg', '.opus', '.wav']
+)
+
+# In order of preference.
+ALBUM_ART_FILENAMES = (
+	'cover.jpg',
+	'cover.png',
+	'folder.jpg',
+	'folder.png',
+	'front.jpg',
+	'front.png',
+	'album.jpg',
+	'album.png',
+)
+
+_DONE = object()
+
+
+def _find_album_art(entries, album_art_filenames):
+	album_art_names = {
+		name.casefold(): index
+		for index, name in enumerate(album_art_filenames)
+	}
+
+	album_art_entry = min(
+		(
+			entry
+			for entry in entries
+			if entry.name.casefold() in album_art_names
+		),
+		key=lambda entry: album_art_names[entry.name.casefold()],
+		default=None
+	)
+
+	if album_art_entry is None:
+		return None
+
+	try:
+		with open(album_art_entry.path, 'rb') as f:
+			return f.read()
+	except OSError:
+		return None
+
+
+def scan_audio_files(
+	paths,
+	*,
+	album_art_filenames=ALBUM_ART_FILENAMES,
+	extensions=AUDIO_EXTENSIONS,
+	max_workers=4,
+	max_queued=1000
+):
+	"""Find audio files and their external album art in files and directories.
+
+	Directories are walked recursively with :func:`os.scandir` across worker threads.
+	External album art is read once per directory.
+	Results are streamed through a bounded queue,
+	so scanning only runs ahead of the consumer by ``max_queued`` files.
+	Files found more than once are yielded once by their first path.
+
+	Parameters:
+		paths (list): Paths to audio files or directories as :class:`os.PathLike` or str.
+		album_art_filenames (list, Optional):
+			Filenames of external album art in order of preference.
+			Matched case-insensitively.
+			Default: :data:`ALBUM_ART_FILENAMES`
+		extensions (set, Optional):
+			Lowercase file extensions of audio files to include.
+			Default: :data:`AUDIO_EXTENSIONS`
+		max_workers (int, Optional):
+			Number of threads scanning directories.
+			Default: ``4``
+		max_queued (int, Optional):
+			Maximum number of found files waiting to be consumed.
+			Default: ``1000``
+
+	Yields:
+		tuple: Audio filepath as str, external album art as bytestring or ``None``.
+	"""
+
+	if isinstance(paths, (str, os.PathLike)):
+		paths = [paths]
+
+	directories = queue.Queue()
+	results = queue.Queue(maxsize=max_queued)
+	lock = threading.Lock()
+	stop = threading.Event()
+	pending = 0
+
+	def put(item):
+		while not stop.is_set():
+			try:
+				results.put(item, timeout=0.1)
+			except queue.Full:
+				continue
+			else:
+				return True
+
+		return False
+
+	def scan_directory(directory):
+		nonlocal pending
+
+		try:
+			with os.scandir(directory) as it:
+				entries = list(it)
+		except OSError:
+			return
+
+		filepaths = []
+		for entry in entries:
+			try:
+				if entry.is_dir(follow_symlinks=False):
+					with lock:
+						pending += 1
+					directories.put(entry.path)
+				elif (
+					entry.is_file()
+					and os.path.splitext(entry.name)[1].casefold() in extensions
+				):
+					filepaths.append(entry.path)
+			except OSError:
+				continue
+
+		if filepaths:
+			album_art = _find_album_art(entries, album_art_filenames)
+
+			for filepath in sorted(filepaths):
+				if not put((filepath, album_art)):
+					return
+
+	def worker():
+		nonlocal pending
+
+		while not stop.is_set():
+			try:
+				directory = directories.get(timeout=0.1)
+			except queue.Empty:
+				continue
+
+			if directory is _DONE:
+				break
+
+			try:
+				scan_directory(directory)
+			finally:
+				with lock:
+					pending -= 1
+					done = pending == 0
+
+				if done:
+					for _ in range(max_workers):
+						directories.put(_DONE)
+
+					put(_DONE)
+
+	filepaths = []
+	for path in paths:
+		path = os.fspath(path)
+
+		if os.path.isdir(path):
+			pending += 1
+			directories.put(path)
+		elif os.path.splitext(path)[1].casefold() in extensions:
+			filepaths.append(path)
+
+	threads = []
+	if pending:
+		for _ in range(max_workers):
+			thread = threading.Thread(target=worker, daemon=True)
+			thread.start()
+			threads.append(thread)
+
+	try:
+		seen = set()
+		album_arts = {}
+		for filepath in filepaths:
+			realpath = os.path.realpath(filepath)
+			if realpath in seen:
+				continue
+
+			seen.add(realpath)
+
+			directory = os.path.dirname(os.path.abspath(filepath))
+
+			if directory not in album_arts:
+				try:
+					with os.scandir(directory) as it:
+						album_arts[directory] = _find_album_art(list(it), album_art_filenames)
+				except OSError:
+					album_arts[directory] = None
+
+			yield (filepath, album_arts[directory])
+
+		if threads:
+			while True:
+				item = results.get()
+
+				if item is _DONE:
+					break
+
+				realpath = os.path.realpath(item[0])
+				if realpath in seen:
+					continue
+
+				seen.add(realpath)
+
+				yield item
+	finally:
+		stop.set()
@@ -2,6 +2,8 @@ __all__ = [
 	'GoogleMusicSession',
 ]
 
+import hashlib
+
 import httpx
 from google_music_proto.oauth import AUTHORIZATION_BASE_URL, REDIRECT_URI, TOKEN_URL
 from oauthlib.common import generate_token, urldecode
@@ -12,6 +14,20 @@ from .__about__ import __title__, __version__
 
 # Adapted from requests-oauthlib for use with httpx.
 class GoogleMusicSession(httpx.Client):
+	"""An OAuth2 HTTP session for Google Music.
+
+	Parameters:
+		client_id (str): An OAuth client ID.
+		client_secret (str): An OAuth client secret.
+		scope (str): An OAuth scope.
+		token (dict, Optional):
+			An OAuth token compatible with ``oauthlib``.
+		http_cache (:class:`~google_music.HTTPCache`, Optional):
+			A cache of GET responses revalidated with conditional requests.
+			Can be changed after instantiation.
+		kwargs (Optional): Keyword arguments passed to :class:`httpx.Client`.
+	"""
+
 	authorization_base_url = AUTHORIZATION_BASE_URL
 	redirect_uri = REDIRECT_URI
 	token_url = TOKEN_URL
@@ -23,6 +39,7 @@ class GoogleMusicSession(httpx.Client):
 		scope,
 		*,
 		token=None,
+		http_cache=None,
 		**kwargs
 	):
 		# httpx sets a default timeout on the Client class.
@@ -44,6 +61,8 @@ class GoogleMusicSession(httpx.Client):
 		self.token = token or {}
 		self.oauth_client = WebApplicationClient(self.client_id, token=self.token)
 
+		self.http_cache = http_cache
+
 	@property
 	def access_token(self):
 		return self.token.get('access_token')
@@ -118,6 +137,34 @@ class GoogleMusicSession(httpx.Client):
 
 		return self.token
 
+	def _add_token(self, method, url, data, headers):
+		try:
+			url, headers, data = self.oauth_client.add_token(
+				url,
+				http_method=method,
+				body=data,
+				headers=headers
+			)
+		except TokenExpiredError:
+			self.refresh_token()
+			url, headers, data = self.oauth_client.add_token(
+				url,
+				http_method=method,
+				body=data,
+				headers=headers
+			)
+
+		return url, headers, data
+
+	def _http_cache_key(self, method, url, params):
+		# Responses are per account, so key them on the refresh token,
+		# which doesn't change when the access token is refreshed.
+		account = hashlib.sha256(
+			(self.token.get('refresh_token') or '').encode()
+		).hexdigest()
+
+		return f"{account} {self.build_request(method, url, params=params).url}"
+
 	def request(
 		self,
 		method,
@@ -128,23 +175,61 @@ class GoogleMusicSession(httpx.Client):
 		**kwargs
 	):
 		if self.token and not withhold_token:
-			try:
-				url, headers, data = self.oauth_client.add_token(
-					url,
-					http_method=method,
-					body=data,
-					headers=headers
-				)
-			except TokenExpiredError:
-				self.refresh_token()
-				url, headers, data = self.oauth_client.add_token(
-					url,
-					http_method=method,
-					body=data,
-					headers=headers
+			url, headers, data = self._add_token(method, url, data, headers)
+
+		# Token-withheld requests are for one-off signed URLs, e.g. audio streams.
+		cache_key = cached = None
+		if (
+			self.http_cache is not None
+			and method.upper() == 'GET'
+			and not withhold_token
+		):
+			cache_key = self._http_cache_key(method, url, kwargs.get('params'))
+			cached = self.http_cache.get(cache_key)
+
+			if cached is not None:
+				headers = {**(headers or {}), **cached['validators']}
+
+		response = super().request(
+			method,
+			url,
+			headers=headers,
+			data=data,
+			**kwargs
+		)
+
+		if cache_key is not None:
+			if response.status_code == 304 and cached is not None:
+				response = httpx.Response(
+					200,
+					headers=cached['headers'],
+					content=cached['content'],
+					request=response.request
 				)
+			elif response.status_code == 200:
+				self.http_cache.set(cache_key, response)
+
+		return response
+
+	def stream(
+		self,
+		method,
+		url,
+		data=None,
+		headers=None,
+		withhold_token=False,
+		**kwargs
+	):
+		"""Send a request without loading the response content.
+
+		Used as a context manager, the response content can be
+		iterated over in chunks with ``response.iter_bytes()``.
+		"""
+
+		if self.token and not withhold_token:
+			url, headers, data = self._add_token(method, url, data, headers)
 
-		return super().request(
+		return super().stream(
 			method,
 			url,
 			headers=headers,
@@ -0,0 +1,189 @@
+__all__ = [
+	'StationQueue',
+]
+
+import queue
+import threading
+from collections import deque
+
+import httpx
+
+_DONE = object()
+
+
+class StationQueue:
+	"""A read-ahead playback queue for a station.
+
+	A background thread keeps the next ``prefetch`` tracks ready,
+	with their stream URLs resolved and the first chunk of audio buffered.
+	Tracks are refilled from the station feed as needed,
+	passing previously queued tracks as ``recently_played``.
+
+	Iterating over the queue yields ``(track, stream)`` tuples
+	where ``stream`` is an iterator of MP3 chunks starting with the buffered chunk.
+	Iteration ends when the station returns no more tracks or the queue is closed.
+
+	>>> with mc.station_queue('IFL') as station_queue:
+	... 	for track, stream in station_queue:
+	... 		play(stream)
+
+	Parameters:
+		client (:class:`~google_music.MobileClient`): A mobile client.
+		station_id (str):
+			A station ID.
+			Use 'IFL' for I'm Feeling Lucky.
+		prefetch (int, Optional):
+			Number of upcoming tracks to keep ready.
+			Default: ``3``
+		first_chunk_size (int, Optional):
+			Number of bytes of audio to buffer for each ready track.
+			Default: ``262144``
+		num_songs (int, Optional):
+			Number of songs to request from the station feed per refill.
+			Default: ``25``
+		device_id (str, Optional):
+			A mobile device ID.
+			Default: Use the client's ``device_id``.
+		quality (str, Optional):
+			Stream quality as accepted by :meth:`~google_music.MobileClient.stream`.
+			Default: ``'hi'``.
+		max_recently_played (int, Optional):
+			Maximum number of tracks passed as ``recently_played`` on refill.
+			Default: ``100``
+	"""
+
+	def __init__(
+		self,
+		client,
+		station_id,
+		*,
+		prefetch=3,
+		first_chunk_size=256 * 1024,
+		num_songs=25,
+		device_id=None,
+		quality='hi',
+		max_recently_played=100
+	):
+		self.client = client
+		self.station_id = station_id
+		self.first_chunk_size = first_chunk_size
+		self.num_songs = num_songs
+		self.device_id = device_id or client.device_id
+		self.quality = quality
+
+		self._ready = queue.Queue(maxsize=prefetch)
+		self._recently_played = deque(maxlen=max_recently_played)
+		self._stop = threading.Event()
+
+		self._thread = threading.Thread(target=self._fill, daemon=True)
+		self._thread.start()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *args):
+		self.close()
+
+	def __iter__(self):
+		while not self._stop.is_set():
+			item = self._ready.get()
+
+			if item is _DONE:
+				break
+			elif isinstance(item, Exception):
+				raise item
+
+			track, first_chunk, session_token = item
+
+			yield track, self._stream(track, first_chunk, session_token)
+
+	def __repr__(self):
+		return f"StationQueue(station_id={self.station_id!r})"
+
+	def _put(self, item):
+		while not self._stop.is_set():
+			try:
+				self._ready.put(item, timeout=0.1)
+			except queue.Full:
+				continue
+			else:
+				return True
+
+		return False
+
+	def _fill(self):
+		try:
+			while not self._stop.is_set():
+				station = self.client.station(
+					self.station_id,
+					num_songs=self.num_songs,
+					recently_played=list(self._recently_played)
+				)
+				tracks = station.get('tracks', [])
+				session_token = station.get('sessionToken')
+
+				if not tracks:
+					break
+
+				for track in tracks:
+					if self._stop.is_set():
+						return
+
+					self._recently_played.append(
+						{
+							'id': track.get('storeId') or track.get('id'),
+							'type': 1 if 'storeId' in track else 0,
+						}
+					)
+
+					try:
+						first_chunk = b''.join(
+							self.client.stream_iter(
+								track,
+								device_id=self.device_id,
+								quality=self.quality,
+								session_token=session_token,
+								start=0,
+								end=self.first_chunk_size - 1
+							)
+						)
+					except (ValueError, httpx.HTTPError):  # Skip unplayable tracks.
+						continue
+
+					if not self._put((track, first_chunk, session_token)):
+						return
+		except Exception as e:  # noqa
+			self._put(e)
+		else:
+			self._put(_DONE)
+
+	def _stream(self, track, first_chunk, session_token):
+		yield first_chunk
+
+		# The whole track fit in the first chunk
+		# or the range was ignored and the whole track was sent.
+		if len(first_chunk) != self.first_chunk_size:
+			return
+
+		try:
+			yield from self.client.stream_iter(
+				track,
+				device_id=self.device_id,
+				quality=self.quality,
+				session_token=session_token,
+				start=len(first_chunk)
+			)
+		except httpx.HTTPError as e:
+			# The track was exactly first_chunk_size bytes long.
+			if getattr(getattr(e, 'response', None), 'status_code', None) != 416:
+				raise
+
+	def close(self):
+		"""Stop refilling the queue."""
+
+		self._stop.set()
+
+		try:
+			self._ready.put_nowait(_DONE)
+		except queue.Full:
+			pass
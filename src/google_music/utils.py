@@ -1,4 +1,14 @@
-__all__ = ['create_mac_string', 'get_ple_prev_next']
+__all__ = [
+	'create_mac_string',
+	'get_ple_prev_next',
+	'transcode_with_sample',
+]
+
+import os
+import subprocess
+import tempfile
+
+from google_music_proto.musicmanager.utils import get_transcoder
 
 
 def create_mac_string(mac_int, *, delimiter=':'):
@@ -72,3 +82,75 @@ def get_ple_prev_next(
 			next_ = playlist_songs[index]
 
 	return prev, next_
+
+
+def transcode_with_sample(
+	song,
+	*,
+	slice_start,
+	slice_duration,
+	quality='320k',
+	sample_quality='128k'
+):
+	"""Transcode a song to MP3 and cut an audio sample in a single ffmpeg/avconv pass.
+
+	The source is only decoded once, with the transcoded audio
+	written to stdout and the sample written to a temporary file.
+
+	Parameters:
+		song (audio_metadata.Format): An instance of :class:`audio_metadata.Format`.
+		slice_start (int): Start of the sample in seconds.
+		slice_duration (int): Duration of the sample in seconds.
+		quality (str, Optional):
+			Bitrate of the transcoded audio.
+			Default: ``'320k'``
+		sample_quality (str, Optional):
+			Bitrate of the audio sample.
+			Default: ``'128k'``
+
+	Returns:
+		tuple: Transcoded audio as bytestring, audio sample as bytestring.
+	"""
+
+	if song.filepath is None:
+		raise ValueError("Audio metadata must be from a file.")
+
+	command_path = get_transcoder()
+
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		sample_path = os.path.join(tmp_dir, 'sample.mp3')
+
+		# Use 's16le' to not output id3 headers.
+		command = [
+			command_path, '-y', '-i', song.filepath,
+			'-b:a', quality, '-f', 's16le', '-c', 'libmp3lame', 'pipe:1',
+			'-ss', str(slice_start), '-t', str(slice_duration),
+			'-b:a', sample_quality, '-f', 's16le', '-c', 'libmp3lame', sample_path,
+		]
+
+		transcode = None
+		try:
+			transcode = subprocess.run(
+				command,
+				stdout=subprocess.PIPE,
+				stderr=subprocess.PIPE,
+			)
+
+			transcode.check_returncode()
+		except (OSError, subprocess.CalledProcessError) as e:
+			error_msg = f"Transcode command '{' '.join(command)}' failed: {e}. "
+
+			if 'No such file or directory' in str(e):
+				error_msg += '\nffmpeg or avconv must be installed PATH.'
+
+			if transcode is not None and transcode.stderr is not None:
+				error_msg += f"\nstderr: '{transcode.stderr}'"
+
+			e.message = error_msg
+
+			raise
+
+		with open(sample_path, 'rb') as f:
+			sample = f.read()
+
+	return transcode.stdout, sample
@@ -0,0 +1,242 @@
+import math
+import time
+
+import httpx
+import pytest
+
+from google_music import (
+	AudioCache,
+	DiskCache,
+	HTTPCache,
+	MemoryCache,
+	ResponseCache,
+	SearchCache,
+	StreamURLCache,
+)
+
+SEARCH_CONTEXT = {
+	'locale': 'en_US',
+	'tier': 'aa',
+	'types': [],
+}
+
+
+def test_search_cache_normalize():
+	assert SearchCache.normalize('  Foo   BAR ') == 'foo bar'
+
+
+def test_search_cache_results_normalized_query():
+	search_cache = SearchCache()
+	results = {'songs': [{'title': 'Foo'}]}
+
+	search_cache.set_results('Foo  Bar', results, max_results=10, **SEARCH_CONTEXT)
+
+	assert search_cache.get_results('foo bar', max_results=10, **SEARCH_CONTEXT) == results
+	assert search_cache.get_results('foo bar', max_results=10, **{**SEARCH_CONTEXT, 'tier': 'fr'}) is None
+
+
+def test_search_cache_prefix_reuse_drops_non_matching():
+	search_cache = SearchCache()
+	songs = [
+		{'kind': 'sj#track', 'storeId': 'Tracker', 'title': 'Track Star', 'artist': 'Foo'},
+		{'kind': 'sj#track', 'storeId': 'Ttrack', 'title': 'Trapped', 'artist': 'Bar'},
+		{'kind': 'sj#track', 'nid': 'track', 'title': 'Traveler', 'artist': 'Trackers'},
+	]
+
+	search_cache.set_results('tra', {'songs': songs}, max_results=10, **SEARCH_CONTEXT)
+
+	results = search_cache.get_results('track', max_results=10, **SEARCH_CONTEXT)
+
+	assert results == {'songs': [songs[0], songs[2]]}
+
+
+def test_search_cache_prefix_reuse_matches_every_term():
+	search_cache = SearchCache()
+	songs = [
+		{'title': 'Track Star', 'artist': 'Foo'},
+		{'title': 'Track Star', 'artist': 'Bar'},
+	]
+
+	search_cache.set_results('track', {'songs': songs}, max_results=10, **SEARCH_CONTEXT)
+
+	results = search_cache.get_results('track foo', max_results=10, **SEARCH_CONTEXT)
+
+	assert results == {'songs': [songs[0]]}
+
+
+def test_search_cache_prefix_reuse_incomplete_results():
+	search_cache = SearchCache()
+	songs = [{'title': f'Track {i}'} for i in range(10)]
+
+	search_cache.set_results('tra', {'songs': songs}, max_results=10, **SEARCH_CONTEXT)
+
+	assert search_cache.get_results('track', max_results=10, **SEARCH_CONTEXT) is None
+
+
+def test_search_cache_prefix_reuse_truncated_results_stay_complete():
+	search_cache = SearchCache()
+	songs = [{'title': f'Track {i}'} for i in range(5)]
+
+	search_cache.set_results('tra', {'songs': songs}, max_results=10, **SEARCH_CONTEXT)
+
+	assert search_cache.get_results('track', max_results=2, **SEARCH_CONTEXT) == {'songs': songs[:2]}
+	assert search_cache.get_results('track', max_results=10, **SEARCH_CONTEXT) == {'songs': songs}
+
+
+def test_memory_cache_evicts_least_recently_used():
+	cache = MemoryCache(maxsize=2)
+
+	cache.set('a', 1, math.inf)
+	cache.set('b', 2, math.inf)
+	cache.get('a')
+	cache.set('c', 3, math.inf)
+
+	assert cache.get('a') == (1, math.inf)
+	assert cache.get('b') is None
+	assert cache.get('c') == (3, math.inf)
+
+
+def test_memory_cache_copies_values():
+	cache = MemoryCache()
+	value = {'items': [1]}
+
+	cache.set('key', value, math.inf)
+	value['items'].append(2)
+	cache.get('key')[0]['items'].append(3)
+
+	assert cache.get('key')[0] == {'items': [1]}
+
+
+def test_disk_cache_round_trip(tmp_path):
+	filepath = tmp_path / 'cache.sqlite'
+
+	with DiskCache(filepath) as cache:
+		cache.set('key', {'items': [1, 2]}, 123.0)
+
+	with DiskCache(filepath) as cache:
+		assert cache.get('key') == ({'items': [1, 2]}, 123.0)
+		assert cache.get('missing') is None
+
+		cache.delete('key')
+
+		assert cache.get('key') is None
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+	with DiskCache(tmp_path / 'cache.sqlite', maxsize=2) as cache:
+		cache.set('a', 1, math.inf)
+		time.sleep(0.01)
+		cache.set('b', 2, math.inf)
+		time.sleep(0.01)
+		cache.get('a')
+		time.sleep(0.01)
+		cache.set('c', 3, math.inf)
+
+		assert len(cache) == 2
+		assert cache.get('b') is None
+
+
+def test_response_cache_keys():
+	assert ResponseCache.key('user', 'FetchAlbum', ('B1',)) == ResponseCache.key('user', 'FetchAlbum', ['B1'])
+	assert ResponseCache.key('user', 'FetchAlbum', ('B1',)) != ResponseCache.key('user', 'FetchAlbum', ('B2',))
+	assert ResponseCache.key('user1', 'FetchAlbum', ('B1',)) != ResponseCache.key('user2', 'FetchAlbum', ('B1',))
+
+
+def test_response_cache_ttls():
+	response_cache = ResponseCache(ttls={'Config': None, 'FetchTrack': 10})
+
+	assert response_cache.ttl('Config') is None
+	assert response_cache.ttl('FetchTrack') == 10
+	assert response_cache.ttl('FetchAlbum') == ResponseCache.default_ttls['FetchAlbum']
+	assert response_cache.ttl('TrackFeed') is None
+
+
+def test_response_cache_expiry():
+	response_cache = ResponseCache()
+
+	response_cache.set('fresh', 'value', 60)
+	response_cache.set('expired', 'value', -1)
+
+	assert response_cache.get('fresh') == 'value'
+	assert response_cache.get('expired') is None
+	assert response_cache.get_entry('expired')[0] == 'value'
+
+
+def test_http_cache_requires_validators():
+	http_cache = HTTPCache()
+
+	http_cache.set('no-validators', httpx.Response(200, content=b'body'))
+	http_cache.set(
+		'no-store',
+		httpx.Response(200, headers={'ETag': '"a"', 'Cache-Control': 'no-store'}, content=b'body')
+	)
+	http_cache.set(
+		'etag',
+		httpx.Response(200, headers={'ETag': '"a"', 'Content-Length': '4'}, content=b'body')
+	)
+
+	assert http_cache.get('no-validators') is None
+	assert http_cache.get('no-store') is None
+
+	entry = http_cache.get('etag')
+
+	assert entry['validators'] == {'If-None-Match': '"a"'}
+	assert entry['content'] == b'body'
+	assert 'content-length' not in dict(entry['headers'])
+
+
+def test_audio_cache_round_trip(tmp_path):
+	audio_cache = AudioCache(tmp_path)
+
+	audio_cache.set(('song', 'hi'), b'audio')
+
+	assert audio_cache.get(('song', 'hi')) == b'audio'
+	assert audio_cache.get(('song', 'low')) is None
+	assert AudioCache(tmp_path).get(('song', 'hi')) == b'audio'
+
+
+def test_audio_cache_evicts_least_recently_used(tmp_path):
+	audio_cache = AudioCache(tmp_path, max_size=10)
+
+	audio_cache.set('a', b'12345')
+	audio_cache.set('b', b'12345')
+	audio_cache.get('a')
+	audio_cache.set('c', b'12345')
+
+	assert audio_cache.get('a') == b'12345'
+	assert audio_cache.get('b') is None
+	assert audio_cache.get('c') == b'12345'
+
+
+def test_audio_cache_writer_discards_failed_writes(tmp_path):
+	audio_cache = AudioCache(tmp_path)
+
+	with pytest.raises(RuntimeError):
+		with audio_cache.writer('key') as f:
+			f.write(b'partial')
+
+			raise RuntimeError
+
+	assert audio_cache.get('key') is None
+	assert list(tmp_path.iterdir()) == []
+
+
+def test_audio_cache_startup_sweeps_and_evicts(tmp_path):
+	AudioCache(tmp_path).set('key', b'12345')
+	(tmp_path / 'orphan.tmp').write_bytes(b'partial')
+
+	audio_cache = AudioCache(tmp_path, max_size=4)
+
+	assert len(audio_cache) == 0
+	assert list(tmp_path.iterdir()) == []
+
+
+def test_stream_url_cache_expiry():
+	stream_url_cache = StreamURLCache(margin=60)
+	now = int(time.time())
+
+	stream_url_cache.set('fresh', f'https://example.com/audio?expire={now + 600}')
+	stream_url_cache.set('expiring', f'https://example.com/audio?expire={now + 30}')
+
+	assert stream_url_cache.get('fresh') is not None
+	assert stream_url_cache.get('expiring') is None
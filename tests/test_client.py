@@ -0,0 +1,44 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from google_music.clients.base import GoogleMusicClient
+
+
+def make_client():
+	client = GoogleMusicClient.__new__(GoogleMusicClient)
+	client._in_flight = {}
+	client._in_flight_lock = threading.Lock()
+
+	return client
+
+
+def test_call_once_coalesces_concurrent_calls():
+	client = make_client()
+	call = SimpleNamespace(method='GET', url='https://example.com', body=None)
+	requests = []
+
+	def request(call, params):
+		requests.append(call)
+		time.sleep(0.1)
+
+		return {'items': [1]}
+
+	results = []
+	threads = [
+		threading.Thread(target=lambda: results.append(client._call_once(request, call, {})))
+		for _ in range(3)
+	]
+
+	for thread in threads:
+		thread.start()
+
+	for thread in threads:
+		thread.join()
+
+	assert len(requests) == 1
+	assert results == [{'items': [1]}] * 3
+
+	# Each caller can mutate its own response.
+	assert len({id(result) for result in results}) == 3
+	assert client._in_flight == {}
@@ -0,0 +1,66 @@
+import os
+
+from google_music import UploadJournal
+
+
+def test_upload_journal_stages(tmp_path):
+	song = tmp_path / 'song.mp3'
+	song.write_bytes(b'audio')
+
+	with UploadJournal(tmp_path / 'journal.jsonl') as journal:
+		assert journal.get(song) is None
+
+		journal.record(song, 'negotiated', server_track_id='id', response_code=1)
+		journal.record(song, 'session', upload_url='https://example.com', content_type='audio/mpeg')
+
+		entry = journal.get(song)
+
+		assert entry['stage'] == 'session'
+		assert entry['server_track_id'] == 'id'
+		assert entry['upload_url'] == 'https://example.com'
+		assert journal.in_progress() == [os.path.abspath(song)]
+		assert journal.completed() == []
+
+
+def test_upload_journal_negotiated_starts_new_attempt(tmp_path):
+	song = tmp_path / 'song.mp3'
+	song.write_bytes(b'audio')
+
+	with UploadJournal(tmp_path / 'journal.jsonl') as journal:
+		journal.record(song, 'negotiated', server_track_id='id1', response_code=1)
+		journal.record(song, 'session', upload_url='https://example.com', content_type='audio/mpeg')
+		journal.record(song, 'negotiated', server_track_id='id2', response_code=1)
+
+		entry = journal.get(song)
+
+		assert entry['server_track_id'] == 'id2'
+		assert 'upload_url' not in entry
+
+
+def test_upload_journal_resumes_from_file(tmp_path):
+	song = tmp_path / 'song.mp3'
+	song.write_bytes(b'audio')
+	journal_path = tmp_path / 'journal.jsonl'
+
+	with UploadJournal(journal_path) as journal:
+		journal.record(song, 'confirmed', success=True, reason='Uploaded', song_id='id')
+
+	# A line partially written when the job died.
+	with journal_path.open('a') as f:
+		f.write('{"filepath": ')
+
+	with UploadJournal(journal_path) as journal:
+		assert journal.get(song)['song_id'] == 'id'
+		assert journal.completed() == [os.path.abspath(song)]
+
+
+def test_upload_journal_ignores_changed_files(tmp_path):
+	song = tmp_path / 'song.mp3'
+	song.write_bytes(b'audio')
+
+	with UploadJournal(tmp_path / 'journal.jsonl') as journal:
+		journal.record(song, 'confirmed', success=True, reason='Uploaded', song_id='id')
+
+		song.write_bytes(b'edited audio')
+
+		assert journal.get(song) is None
@@ -0,0 +1,52 @@
+from google_music import UploadManifest
+
+
+def test_upload_manifest_skips_unchanged_files(tmp_path):
+	song = tmp_path / 'song.mp3'
+	song.write_bytes(b'audio')
+
+	with UploadManifest(tmp_path / 'manifest.sqlite') as manifest:
+		assert manifest.get(song) is None
+
+		manifest.add(song, 'client_id', 'server_id', 'Uploaded')
+
+		entry = manifest.get(song)
+
+		assert entry['server_track_id'] == 'server_id'
+		assert entry['reason'] == 'Uploaded'
+
+
+def test_upload_manifest_ignores_changed_files(tmp_path):
+	song = tmp_path / 'song.mp3'
+	song.write_bytes(b'audio')
+
+	with UploadManifest(tmp_path / 'manifest.sqlite') as manifest:
+		manifest.add(song, 'client_id', 'server_id', 'Uploaded')
+
+		song.write_bytes(b'edited audio')
+
+		assert manifest.get(song) is None
+		assert manifest.get_by_client_id('client_id')['server_track_id'] == 'server_id'
+
+
+def test_upload_manifest_remove(tmp_path):
+	song = tmp_path / 'song.mp3'
+	song.write_bytes(b'audio')
+
+	with UploadManifest(tmp_path / 'manifest.sqlite') as manifest:
+		manifest.add(song, 'client_id', 'server_id', 'Uploaded')
+		manifest.remove(song)
+
+		assert manifest.get(song) is None
+		assert manifest.get_by_client_id('client_id') is None
+
+
+def test_upload_manifest_persists(tmp_path):
+	song = tmp_path / 'song.mp3'
+	song.write_bytes(b'audio')
+
+	with UploadManifest(tmp_path / 'manifest.sqlite') as manifest:
+		manifest.add(song, 'client_id', 'server_id', 'Uploaded')
+
+	with UploadManifest(tmp_path / 'manifest.sqlite') as manifest:
+		assert manifest.get(song)['client_id'] == 'client_id'
@@ -0,0 +1,122 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from google_music import MobileClient, StreamURLCache
+
+
+@pytest.fixture
+def mc():
+	mc = MobileClient.__new__(MobileClient)
+	mc._session = SimpleNamespace(params={}, headers={})
+	mc._stream_url_cache = StreamURLCache()
+
+	return mc
+
+
+def test_fetch_many_order_and_duplicates():
+	fetched = []
+
+	def fetch(id_):
+		fetched.append(id_)
+
+		if id_ == 'bad':
+			raise ValueError(id_)
+
+		return id_.upper()
+
+	results = MobileClient._fetch_many(fetch, (id_ for id_ in ['a', 'bad', 'b', 'a']))
+
+	assert results[0] == 'A'
+	assert isinstance(results[1], ValueError)
+	assert results[2:] == ['B', 'A']
+	assert sorted(fetched) == ['a', 'b', 'bad']
+
+
+def test_station_feed_matches_stations_by_id_and_seed(mc):
+	def call(call_cls, *, station_infos):
+		return SimpleNamespace(
+			body={
+				'data': {
+					'stations': [
+						{'id': 'artist_station', 'seed': {'seedType': '3', 'artistId': 'artist_id'}},
+						{'id': 'station_id'},
+					],
+				},
+			}
+		)
+
+	mc._call = call
+
+	stations = mc._station_feed(
+		[
+			{'station_id': 'station_id'},
+			{'seed': {'seedType': 4, 'albumId': 'album_id'}},
+			{'seed': {'seedType': 3, 'artistId': 'artist_id'}},
+		]
+	)
+
+	assert [station.get('id') for station in stations] == ['station_id', None, 'artist_station']
+
+
+def test_stream_url_cache_hit_skips_config(mc):
+	calls = []
+
+	def config():
+		calls.append('Config')
+
+		return [{'key': 'isNautilusUser', 'value': 'true'}]
+
+	def call(call_cls, *args, **kwargs):
+		calls.append(call_cls.__name__)
+
+		return SimpleNamespace(
+			headers={'Location': f'https://example.com/audio?expire={int(time.time()) + 600}'},
+			body={}
+		)
+
+	mc.config = config
+	mc._call = call
+
+	song = {'id': 'library_id', 'storeId': 'store_id'}
+	urls = {mc.stream_url(song, device_id='device_id') for _ in range(3)}
+
+	assert len(urls) == 1
+	assert calls == ['Config', 'TrackStreamURL']
+
+
+def test_stream_to_dir_skips_duplicates(mc, tmp_path):
+	def stream_to(item, f, **kwargs):
+		f.write(MobileClient._item_id(item).encode())
+
+	mc.stream_to = stream_to
+
+	results = list(
+		mc.stream_to_dir(
+			[{'id': 'a'}, {'trackId': 'b'}, {'id': 'a'}],
+			tmp_path,
+			device_id='device_id'
+		)
+	)
+
+	assert sorted(result['reason'] for result in results) == ['Downloaded', 'Downloaded', 'Duplicate']
+	assert (tmp_path / 'a.mp3').read_bytes() == b'a'
+	assert sorted(path.name for path in tmp_path.iterdir()) == ['a.mp3', 'b.mp3']
+
+
+def test_crawl_catalog_resumes_from_checkpoint(mc, tmp_path):
+	mc.artist = lambda artist_id: artist_id
+	mc._catalog_links = lambda node_type, info: [('artist', f'{info}1'), ('artist', f'{info}2')]
+	checkpoint = tmp_path / 'checkpoint.jsonl'
+
+	crawl = mc.crawl_catalog([('artist', 'a')], max_depth=2, max_workers=1, checkpoint=checkpoint)
+	first = [next(crawl)['id'] for _ in range(2)]
+	crawl.close()
+
+	rest = [
+		result['id']
+		for result in mc.crawl_catalog([('artist', 'ignored')], max_depth=2, max_workers=1, checkpoint=checkpoint)
+	]
+
+	assert sorted(first + rest) == ['a', 'a1', 'a11', 'a12', 'a2', 'a21', 'a22']
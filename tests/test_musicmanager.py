@@ -0,0 +1,161 @@
+import contextlib
+from pathlib import Path
+
+import httpx
+import pytest
+from google_music_proto.musicmanager.pb import download_pb2
+
+from google_music import MusicManager
+from google_music.clients import musicmanager
+
+
+@pytest.fixture
+def mm(monkeypatch):
+	monkeypatch.setattr(musicmanager.time, 'sleep', lambda seconds: None)
+
+	mm = MusicManager.__new__(MusicManager)
+	mm._uploader_id = 'uploader_id'
+
+	return mm
+
+
+def stream_responses(mm, responses):
+	"""Answer download requests with the given responses in order and record their headers."""
+
+	requests = []
+
+	@contextlib.contextmanager
+	def stream(call_cls, uploader_id, song_id, *, headers=None):
+		requests.append(headers)
+
+		yield responses.pop(0)
+
+	mm._stream = stream
+
+	return requests
+
+
+def response(status_code, content=b'', headers=None):
+	return httpx.Response(
+		status_code,
+		headers=headers,
+		content=content,
+		request=httpx.Request('GET', 'https://example.com/song')
+	)
+
+
+def test_download_to(mm, tmp_path):
+	requests = stream_responses(mm, [response(200, b'audio')])
+
+	filepath = mm.download_to({'id': 'song_id'}, tmp_path / 'song.mp3')
+
+	assert filepath.read_bytes() == b'audio'
+	assert requests == [None]
+	assert not (tmp_path / 'song.mp3.part').exists()
+
+
+def test_download_to_resumes_part_file(mm, tmp_path):
+	(tmp_path / 'song.mp3.part').write_bytes(b'aud')
+	requests = stream_responses(
+		mm,
+		[response(206, b'io', {'Content-Range': 'bytes 3-4/5'})]
+	)
+
+	filepath = mm.download_to({'id': 'song_id'}, tmp_path / 'song.mp3')
+
+	assert filepath.read_bytes() == b'audio'
+	assert requests == [{'Range': 'bytes=3-'}]
+
+
+def test_download_to_ignored_range(mm, tmp_path):
+	(tmp_path / 'song.mp3.part').write_bytes(b'aud')
+	stream_responses(mm, [response(200, b'audio')])
+
+	filepath = mm.download_to({'id': 'song_id'}, tmp_path / 'song.mp3')
+
+	assert filepath.read_bytes() == b'audio'
+
+
+def test_download_to_misaligned_range_starts_over(mm, tmp_path):
+	(tmp_path / 'song.mp3.part').write_bytes(b'aud')
+	requests = stream_responses(
+		mm,
+		[
+			response(206, b'o', {'Content-Range': 'bytes 4-4/5'}),
+			response(200, b'audio'),
+		]
+	)
+
+	filepath = mm.download_to({'id': 'song_id'}, tmp_path / 'song.mp3')
+
+	assert filepath.read_bytes() == b'audio'
+	assert requests == [{'Range': 'bytes=3-'}, None]
+
+
+def test_download_to_complete_part_file(mm, tmp_path):
+	(tmp_path / 'song.mp3.part').write_bytes(b'audio')
+	stream_responses(mm, [response(416, headers={'Content-Range': 'bytes */5'})])
+
+	filepath = mm.download_to({'id': 'song_id'}, tmp_path / 'song.mp3')
+
+	assert filepath.read_bytes() == b'audio'
+
+
+def test_download_to_unsatisfiable_range_starts_over(mm, tmp_path):
+	(tmp_path / 'song.mp3.part').write_bytes(b'audio!')
+	requests = stream_responses(
+		mm,
+		[
+			response(416, headers={'Content-Range': 'bytes */5'}),
+			response(200, b'audio'),
+		]
+	)
+
+	filepath = mm.download_to({'id': 'song_id'}, tmp_path / 'song.mp3')
+
+	assert filepath.read_bytes() == b'audio'
+	assert requests == [{'Range': 'bytes=6-'}, None]
+
+
+def test_download_to_retries_server_errors(mm, tmp_path):
+	stream_responses(mm, [response(503), response(200, b'audio')])
+
+	filepath = mm.download_to({'id': 'song_id'}, tmp_path / 'song.mp3')
+
+	assert filepath.read_bytes() == b'audio'
+
+
+def test_download_to_does_not_retry_client_errors(mm, tmp_path):
+	requests = stream_responses(mm, [response(404), response(200, b'audio')])
+
+	with pytest.raises(httpx.HTTPStatusError):
+		mm.download_to({'id': 'song_id'}, tmp_path / 'song.mp3')
+
+	assert len(requests) == 1
+
+
+def test_track_info_to_dict_omits_unset_fields():
+	track_info = download_pb2.DownloadTrackInfo(id='song_id', title='Title', track_size=5)
+
+	assert musicmanager._track_info_to_dict(track_info) == {
+		'id': 'song_id',
+		'title': 'Title',
+		'track_size': 5,
+	}
+
+
+def test_library_filepath():
+	song = {
+		'id': 'song_id',
+		'title': 'Title?',
+		'artist': 'Artist',
+		'album_artist': 'Album Artist',
+		'album': 'Album',
+		'track_number': 3,
+		'disc_number': 2,
+		'total_disc_count': 2,
+	}
+
+	assert MusicManager._library_filepath(song) == Path('Album Artist', 'Album', '2-03 - Title_.mp3')
+	assert MusicManager._library_filepath(song, include_id=True) == Path('Album Artist', 'Album', '2-03 - Title_ (song_id).mp3')
+	assert MusicManager._library_filepath({'id': 'song_id'}) == Path('Unknown Artist', 'Unknown Album', '00 - song_id.mp3')
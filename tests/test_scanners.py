@@ -0,0 +1,29 @@
+from google_music import scan_audio_files
+
+
+def test_scan_audio_files(tmp_path):
+	album = tmp_path / 'artist' / 'album'
+	album.mkdir(parents=True)
+	(album / '01.mp3').write_bytes(b'audio')
+	(album / '02.flac').write_bytes(b'audio')
+	(album / 'notes.txt').write_bytes(b'text')
+	(album / 'folder.jpg').write_bytes(b'folder')
+	(album / 'Cover.jpg').write_bytes(b'cover')
+
+	results = list(scan_audio_files(tmp_path))
+
+	assert results == [
+		(str(album / '01.mp3'), b'cover'),
+		(str(album / '02.flac'), b'cover'),
+	]
+
+
+def test_scan_audio_files_yields_each_file_once(tmp_path):
+	album = tmp_path / 'album'
+	album.mkdir()
+	song = album / '01.mp3'
+	song.write_bytes(b'audio')
+
+	results = list(scan_audio_files([song, tmp_path, album]))
+
+	assert results == [(str(song), None)]
@@ -0,0 +1,69 @@
+import httpx
+
+from google_music import GoogleMusicSession, HTTPCache
+
+
+def make_session(handler, *, refresh_token='refresh', http_cache=None):
+	return GoogleMusicSession(
+		'client_id',
+		'client_secret',
+		'scope',
+		token={
+			'access_token': 'access',
+			'refresh_token': refresh_token,
+			'token_type': 'Bearer',
+		},
+		http_cache=http_cache,
+		transport=httpx.MockTransport(handler)
+	)
+
+
+def etag_handler(requests):
+	def handler(request):
+		requests.append(request)
+
+		if request.headers.get('If-None-Match') == '"v1"':
+			return httpx.Response(304)
+
+		return httpx.Response(200, headers={'ETag': '"v1"'}, content=b'body')
+
+	return handler
+
+
+def test_http_cache_revalidates_get_responses():
+	requests = []
+	session = make_session(etag_handler(requests), http_cache=HTTPCache())
+
+	session.request('GET', 'https://example.com/feed')
+	response = session.request('GET', 'https://example.com/feed')
+
+	assert response.status_code == 200
+	assert response.content == b'body'
+	assert requests[1].headers['If-None-Match'] == '"v1"'
+
+
+def test_http_cache_keys_per_account():
+	requests = []
+	http_cache = HTTPCache()
+
+	make_session(etag_handler(requests), refresh_token='account1', http_cache=http_cache).request(
+		'GET',
+		'https://example.com/feed'
+	)
+	make_session(etag_handler(requests), refresh_token='account2', http_cache=http_cache).request(
+		'GET',
+		'https://example.com/feed'
+	)
+
+	assert 'If-None-Match' not in requests[1].headers
+
+
+def test_http_cache_skips_token_withheld_requests():
+	requests = []
+	session = make_session(etag_handler(requests), http_cache=HTTPCache())
+
+	session.request('GET', 'https://example.com/audio', withhold_token=True)
+	session.request('GET', 'https://example.com/audio', withhold_token=True)
+
+	assert 'If-None-Match' not in requests[1].headers
+	assert 'Authorization' not in requests[1].headers